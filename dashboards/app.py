@@ -1,27 +1,28 @@
 import dash
 from dash import dcc, html, Input, Output, ctx
 import plotly.graph_objects as go
-from recore.kinetics import solve
-import numpy as np
-import pandas as pd
-from pathlib import Path
-import subprocess
-import os
+from recore.analyze import analyze
+from recore.kinetics import DEFAULT_PARAMETERS, solve, solve_ensemble, warmup
+from recore.mesh_array import open_mesh_array
+from recore.tally_io import latest_statepoint
 
 app = dash.Dash(__name__, suppress_callback_exceptions=True)
 server = app.server  # for Flask hosting if needed
 
-# --- Helper functions ---
-def get_mesh_extents(flux2d):
-    # These should match the mesh extents in your OpenMC model
-    # For a 10x10 mesh and pitch=1.3:
-    x = np.linspace(-0.65, 0.65, flux2d.shape[0])
-    y = np.linspace(-0.65, 0.65, flux2d.shape[1])
-    return x, y
+# Load the compiled kinetics kernels once per worker, not on the first slider move
+warmup()
 
-def power_fig(rho):
+# --- Helper functions ---
+def power_fig(rho, spread=0):
     t, p = solve(rho_step=rho)
-    fig = go.Figure(go.Scatter(x=t, y=p, mode="lines"))
+    fig = go.Figure(go.Scatter(x=t, y=p, mode="lines", name="nominal"))
+    if spread:
+        # 5-95 % band from a 1000-member ensemble with `spread` % 1-sigma on each parameter
+        cov = (spread / 100 * DEFAULT_PARAMETERS.vector()) ** 2
+        tb, bands = solve_ensemble(rho, cov, n_samples=1000, every=10, seed=0)
+        fig.add_trace(go.Scatter(x=tb, y=bands[2], mode="lines", line=dict(width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=tb, y=bands[0], mode="lines", line=dict(width=0),
+                                 fill="tonexty", name="5–95 %"))
     fig.update_layout(
         xaxis_title="Time (s)",
         yaxis_title="Relative power",
@@ -30,15 +31,14 @@ def power_fig(rho):
     return fig
 
 def mesh_flux_figure():
-    parquet_file = Path("run/mesh_flux.parquet")
-    if not parquet_file.exists():
+    # Memory-mapped sidecar; None if missing or older than the latest statepoint
+    mesh = open_mesh_array("run/mesh_flux.parquet", source=latest_statepoint("run"))
+    if mesh is None:
         return go.Figure()
-    df = pd.read_parquet(parquet_file)
-    flux2d = df.values
-    x, y = get_mesh_extents(flux2d)
+    x, y = mesh.centers()
     fig = go.Figure(
         data=go.Heatmap(
-            z=flux2d.T,
+            z=mesh.mean.T,
             x=x,
             y=y,
             colorbar=dict(title="Flux"),
@@ -73,6 +73,8 @@ def render_tab(tab):
             html.Label("Step Reactivity (ρ):"),
             dcc.Slider(id="rho", min=0.0005, max=0.01, step=0.0005, value=0.002, 
                        marks={i/10000: f"{i/10000:.4f}" for i in range(5, 101, 10)}),
+            html.Label("Kinetics data uncertainty (1σ, %):"),
+            dcc.Slider(id="spread", min=0, max=10, step=1, value=0),
         dcc.Graph(id="g"),
         ], style={"marginTop": 30})
     elif tab == "tab-flux":
@@ -87,10 +89,11 @@ def render_tab(tab):
 # --- Power plot callback ---
 @app.callback(
     Output("g", "figure"),
-    Input("rho", "value")
+    Input("rho", "value"),
+    Input("spread", "value"),
 )
-def update_power_plot(rho):
-    return power_fig(rho)
+def update_power_plot(rho, spread):
+    return power_fig(rho, spread)
 
 # --- Mesh flux plot and re-analyze callback ---
 @app.callback(
@@ -105,8 +108,8 @@ def mesh_flux_update(n_clicks, _):
     status = ""
     if trigger == "reanalyze-btn" and n_clicks:
         try:
-            result = subprocess.run(["python3", "analyze.py"], capture_output=True, text=True, timeout=60)
-            status = result.stdout.splitlines()[-1] if result.stdout else "Re-analysis complete."
+            # In-process; reuses the last result while the statepoint is unchanged
+            status = analyze("run").summary()
         except Exception as e:
             status = f"Error: {e}"
     fig = mesh_flux_figure()
@@ -0,0 +1,138 @@
+"""
+Analyze the latest statepoint of a run directory, in-process.
+
+:func:`analyze` sums the mesh tally over z (one slab at a time), writes the
+self-describing ``mesh_flux.parquet`` (``<tally>_<score>.parquet`` for other
+tallies and scores) plus its memory-mappable sidecar and returns the result.
+Results are kept per run directory for the life of the process and reused
+while the newest ``statepoint.*.h5`` and the written file are unchanged, so a
+dashboard that calls this on every click only pays for the tally read when
+there is something new to read. Nothing here plots unless asked to.
+"""
+
+from pathlib import Path
+from typing import NamedTuple
+import argparse
+import time
+
+import pyarrow.parquet as pq
+
+from recore.mesh_array import MeshArray, source_stamp, write_mesh_array
+from recore.tally_io import MeshTally, latest_statepoint
+
+
+class AnalysisResult(NamedTuple):
+    statepoint: Path
+    mesh: MeshArray
+    parquet: Path
+    seconds: float
+    cached: bool = False
+
+    def summary(self):
+        h5_size = self.statepoint.stat().st_size / 1024
+        parq_size = self.parquet.stat().st_size / 1024
+        note = " (unchanged, reused)" if self.cached else ""
+        return f"Converted: HDF5 {h5_size:.1f} kB → Parquet {parq_size:.1f} kB{note}"
+
+
+_RESULTS = {}  # (run dir, tally, score) -> (statepoint stamp, AnalysisResult)
+
+
+def output_path(run_dir, tally="flux_mesh", score="flux"):
+    """Parquet file :func:`analyze` writes for ``tally``/``score`` in ``run_dir``.
+
+    The default pair keeps the ``mesh_flux.parquet`` name the dashboards read.
+    """
+    if (tally, score) == ("flux_mesh", "flux"):
+        return Path(run_dir) / "mesh_flux.parquet"
+    return Path(run_dir) / f"{tally}_{score}.parquet"
+
+
+def _file_matches(path, stamp, score):
+    # the file on disk, not just our memory of it, must still be this result
+    try:
+        meta = pq.read_schema(path).metadata or {}
+    except OSError:
+        return False
+    meta = {k.decode(): v.decode() for k, v in meta.items()}
+    return meta.get("score") == score and all(
+        meta.get(k) == v for k, v in stamp.items()
+    )
+
+
+def analyze(run_dir="run", tally="flux_mesh", score="flux", force=False):
+    """Analyze the newest statepoint in ``run_dir`` unless it was already done.
+
+    Each tally/score pair has its own output file (see :func:`output_path`),
+    and a remembered result is only reused while that file still holds it.
+    Raises FileNotFoundError if ``run_dir`` has no statepoint.
+    """
+    run_dir = Path(run_dir)
+    statepoint = latest_statepoint(run_dir)
+    if statepoint is None:
+        raise FileNotFoundError(f"No statepoint files found in '{run_dir}/' directory.")
+    key = (run_dir.resolve(), tally, score)
+    stamp = source_stamp(statepoint)
+    if not force and key in _RESULTS and _RESULTS[key][0] == stamp:
+        cached = _RESULTS[key][1]
+        if _file_matches(cached.parquet, stamp, score):
+            return cached._replace(cached=True)
+
+    start = time.perf_counter()
+    with MeshTally(statepoint, name=tally) as mesh:
+        mean, std = mesh.sum_z(score=score)
+        result = MeshArray(mean, std, mesh.lower_left[:2], mesh.upper_right[:2], score)
+    parquet = write_mesh_array(output_path(run_dir, tally, score), result, statepoint)
+    analysis = AnalysisResult(statepoint, result, parquet, time.perf_counter() - start)
+    _RESULTS[key] = (stamp, analysis)
+    return analysis
+
+
+def plot(result: AnalysisResult, show=False, save=None):
+    """Matplotlib heat map of the z-summed tally (imported only when plotting)."""
+    import matplotlib
+
+    if not show:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    mesh = result.mesh
+    plt.imshow(
+        mesh.mean.T,
+        origin="lower",
+        extent=(
+            mesh.lower_left[0],
+            mesh.upper_right[0],
+            mesh.lower_left[1],
+            mesh.upper_right[1],
+        ),
+        aspect="auto",
+    )
+    plt.xlabel("x [cm]")
+    plt.ylabel("y [cm]")
+    plt.title("Mesh Flux")
+    plt.colorbar(label="Flux")
+    plt.tight_layout()
+    if save:
+        plt.savefig(save)
+    if show:
+        plt.show()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Analyze the latest statepoint")
+    ap.add_argument("--run-dir", default="run")
+    ap.add_argument("--show", action="store_true", help="open a plot window")
+    ap.add_argument("--save", type=Path, help="write the plot to this file")
+    ns = ap.parse_args(argv)
+
+    result = analyze(ns.run_dir)
+    print(f"Loading {result.statepoint}")
+    print(result.summary())
+    if ns.show or ns.save:
+        plot(result, show=ns.show, save=ns.save)
+    return result
+
+
+if __name__ == "__main__":
+    main()
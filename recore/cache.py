@@ -0,0 +1,118 @@
+"""
+Content-addressed store of OpenMC statepoints.
+
+A run is keyed by the SHA-256 of its input XML plus the identity of the
+cross-section library, so identical models map to the same entry however
+they were built. Entries live in ``<root>/<key>/`` and the least recently
+used ones are evicted once the store grows past ``max_bytes``.
+"""
+
+from pathlib import Path
+import hashlib
+import os
+import shutil
+import tempfile
+
+INPUT_FILES = ("materials.xml", "geometry.xml", "settings.xml", "tallies.xml")
+DEFAULT_ROOT = Path(
+    os.environ.get("RECORE_CACHE", Path.home() / ".cache" / "recore" / "openmc")
+)
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+def cross_section_identity(cross_sections):
+    """Path, size and mtime of ``cross_sections.xml`` (empty if unset)."""
+    if not cross_sections:
+        return ""
+    path = Path(cross_sections).resolve()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return str(path)
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def model_key(input_dir, cross_sections=None):
+    """Digest of the model XML in ``input_dir`` and the cross-section library."""
+    digest = hashlib.sha256()
+    for name in INPUT_FILES:
+        path = Path(input_dir) / name
+        if path.exists():
+            digest.update(name.encode())
+            digest.update(path.read_bytes())
+    digest.update(cross_section_identity(cross_sections).encode())
+    return digest.hexdigest()
+
+
+class SimulationCache:
+    """Size-bounded LRU store of statepoints keyed by :func:`model_key`."""
+
+    def __init__(self, root=DEFAULT_ROOT, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def lookup(self, key):
+        """Cached statepoint for ``key``, or None. Marks the entry as used."""
+        path = next((self.root / key).glob("statepoint.*.h5"), None)
+        if path is not None:
+            os.utime(path.parent)
+        return path
+
+    def store(self, key, statepoint):
+        """Copy ``statepoint`` into the store under ``key`` and evict if needed."""
+        statepoint = Path(statepoint)
+        entry = self.root / key
+        if not entry.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            staging = Path(tempfile.mkdtemp(dir=self.root, prefix=".tmp-"))
+            shutil.copy2(statepoint, staging / statepoint.name)
+            try:
+                staging.rename(entry)
+            except OSError:  # another process stored the same key first
+                shutil.rmtree(staging, ignore_errors=True)
+        self.evict()
+        return entry / statepoint.name
+
+    def size(self):
+        return sum(p.stat().st_size for p in self.root.glob("*/*") if p.is_file())
+
+    def evict(self):
+        """Drop least recently used entries until the store fits ``max_bytes``."""
+        entries = [p for p in self.root.glob("*") if p.is_dir() and p.name[0] != "."]
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        sizes = {p: sum(f.stat().st_size for f in p.iterdir()) for p in entries}
+        total = sum(sizes.values())
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= sizes[entry]
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def place(cached, target):
+    """Expose a cached statepoint at ``target`` (hard link, copy as fallback)."""
+    target = Path(target)
+    target.unlink(missing_ok=True)
+    try:
+        os.link(cached, target)
+    except OSError:
+        shutil.copy2(cached, target)
+    return target
+
+
+def detach(directory, pattern="statepoint.*.h5"):
+    """Turn hard links from :func:`place` in ``directory`` into private copies.
+
+    OpenMC truncates an existing statepoint in place, so writing through a
+    link would overwrite the cache entry it shares an inode with. Call this
+    before running OpenMC in a directory that may hold placed files.
+    """
+    for path in Path(directory).glob(pattern):
+        if path.stat().st_nlink > 1:
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=path.suffix)
+            os.close(fd)
+            shutil.copy2(path, tmp)
+            os.replace(tmp, path)
@@ -0,0 +1,226 @@
+"""
+SQLite catalog of OpenMC runs: parameters, input hash and summary results.
+
+Every :func:`recore.openmc_run.build_pincell` (and ``extend_run``) adds one
+row when it finishes, holding the pin-cell parameters, the
+:func:`recore.cache.model_key` of the inputs, the statepoint path, k-eff
+± σ, leakage ± σ, wall time and particle rate. Listing or filtering runs
+is then a query on indexed columns, with no HDF5 file opened. The
+database uses WAL mode so parallel sweep workers can write to it while a
+dashboard reads from it.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+import argparse
+import json
+import os
+import sqlite3
+import time
+
+from recore.convergence import summary
+
+DEFAULT_PATH = Path(
+    os.environ.get(
+        "RECORE_CATALOG", Path.home() / ".cache" / "recore" / "catalog.sqlite"
+    )
+)
+
+# Parameters that get their own (indexed) column; all of them are in ``params``
+PARAMETERS = ("fuel_r", "pitch", "enrich", "particles", "batches")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    run_dir TEXT NOT NULL,
+    statepoint TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    fuel_r REAL,
+    pitch REAL,
+    enrich REAL,
+    particles INTEGER,
+    batches INTEGER,
+    batches_run INTEGER,
+    params TEXT NOT NULL,
+    keff REAL,
+    keff_std REAL,
+    leakage REAL,
+    leakage_std REAL,
+    wall_time REAL,
+    particle_rate REAL,
+    cached INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_input_hash ON runs (input_hash);
+CREATE INDEX IF NOT EXISTS runs_statepoint ON runs (statepoint);
+CREATE INDEX IF NOT EXISTS runs_run_dir ON runs (run_dir, created);
+CREATE INDEX IF NOT EXISTS runs_parameters ON runs (fuel_r, pitch, enrich);
+CREATE INDEX IF NOT EXISTS runs_keff ON runs (keff);
+CREATE INDEX IF NOT EXISTS runs_created ON runs (created);
+"""
+
+# Column filters accepted by RunCatalog.find as ``<column>_min``/``<column>_max``
+_RANGES = ("keff", "leakage", "wall_time", "particle_rate", "created")
+
+_COLUMNS = (
+    "id",
+    "created",
+    "run_dir",
+    "statepoint",
+    "input_hash",
+    *PARAMETERS,
+    "batches_run",
+    "keff",
+    "keff_std",
+    "leakage",
+    "leakage_std",
+    "wall_time",
+    "particle_rate",
+    "cached",
+)
+
+
+class RunCatalog:
+    """One SQLite file of run records (see module docstring for the columns)."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # one short transaction per call; committed on success, always closed
+        con = sqlite3.connect(self.path, timeout=30)
+        con.row_factory = sqlite3.Row
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def add(
+        self,
+        statepoint,
+        params,
+        input_hash,
+        wall_time=None,
+        particle_rate=None,
+        cached=False,
+    ):
+        """Record a finished run and return its row id.
+
+        ``params`` are the ``build_pincell`` keywords; k-eff and leakage are
+        read from the statepoint's root datasets.
+        """
+        statepoint = Path(statepoint).resolve()
+        results = summary(statepoint)
+        row = {
+            "created": time.time(),
+            "run_dir": str(statepoint.parent),
+            "statepoint": str(statepoint),
+            "input_hash": input_hash,
+            **{name: params.get(name) for name in PARAMETERS},
+            "batches_run": results["batches"],
+            "params": json.dumps(params, sort_keys=True),
+            "keff": results["keff"],
+            "keff_std": results["keff_std"],
+            "leakage": results["leakage"],
+            "leakage_std": results["leakage_std"],
+            "wall_time": wall_time,
+            "particle_rate": particle_rate,
+            "cached": int(cached),
+        }
+        columns = ", ".join(row)
+        marks = ", ".join(f":{name}" for name in row)
+        with self._connect() as con:
+            cursor = con.execute(f"INSERT INTO runs ({columns}) VALUES ({marks})", row)
+        return cursor.lastrowid
+
+    def find(self, limit=None, order_by="created DESC", **filters):
+        """Runs matching ``filters``, newest first, as a list of dicts.
+
+        ``order_by`` is a single ``"<column> [ASC|DESC]"``.
+
+        A filter is either a column name with the value it must equal
+        (``pitch=1.3``, ``input_hash=...``, ``run_dir=...``) or one of
+        ``keff``, ``leakage``, ``wall_time``, ``particle_rate`` and
+        ``created`` with a ``_min``/``_max`` suffix for an inclusive bound.
+        """
+        clauses, values = [], []
+        for name, value in filters.items():
+            column, _, bound = name.rpartition("_")
+            if bound in ("min", "max") and column in _RANGES:
+                clauses.append(f"{column} {'>=' if bound == 'min' else '<='} ?")
+            elif name in _COLUMNS:
+                if name in ("statepoint", "run_dir"):
+                    value = str(Path(value).resolve())
+                clauses.append(f"{name} = ?")
+            else:
+                raise ValueError(f"Unknown catalog filter {name!r}")
+            values.append(value)
+        sql = "SELECT * FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {_order_by(order_by)}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._connect() as con:
+            return [_record(row) for row in con.execute(sql, values)]
+
+    def latest(self, **filters):
+        """Newest run matching ``filters`` (see :meth:`find`), or None."""
+        found = self.find(limit=1, **filters)
+        return found[0] if found else None
+
+    def __len__(self):
+        with self._connect() as con:
+            return con.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+
+def _order_by(order_by):
+    # only "<column> [ASC|DESC]" ever reaches the SQL
+    words = order_by.split()
+    if not 1 <= len(words) <= 2 or words[0] not in _COLUMNS:
+        raise ValueError(f"Cannot order by {order_by!r}")
+    direction = words[1].upper() if len(words) == 2 else "ASC"
+    if direction not in ("ASC", "DESC"):
+        raise ValueError(f"Cannot order by {order_by!r}")
+    return f"{words[0]} {direction}"
+
+
+def _record(row):
+    record = dict(row)
+    record["params"] = json.loads(record["params"])
+    record["cached"] = bool(record["cached"])
+    return record
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="List runs in the run catalog")
+    ap.add_argument("--catalog", type=Path, default=DEFAULT_PATH)
+    ap.add_argument("-n", "--limit", type=int, default=20)
+    ap.add_argument("--fuel-r", type=float)
+    ap.add_argument("--pitch", type=float)
+    ap.add_argument("--enrich", type=float)
+    ap.add_argument("--keff-min", type=float)
+    ap.add_argument("--keff-max", type=float)
+    ns = ap.parse_args()
+
+    filters = {
+        name: value
+        for name, value in vars(ns).items()
+        if name not in ("catalog", "limit") and value is not None
+    }
+    for run in RunCatalog(ns.catalog).find(limit=ns.limit, **filters):
+        rate = f"{run['particle_rate']:,.0f}/s" if run["particle_rate"] else "cached"
+        keff = "no active batches"
+        if run["keff"] is not None:
+            keff = f"k={run['keff']:.5f} ± {run['keff_std']:.5f}  leak={run['leakage']:.4f}"
+        print(
+            f"{run['id']:>6}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(run['created']))}"
+            f"  r={run['fuel_r']} p={run['pitch']} e={run['enrich']}"
+            f"  {keff}  {rate}  {run['statepoint']}"
+        )
@@ -0,0 +1,179 @@
+"""
+Benchmark Parquet codecs and encodings on tally tables.
+
+Every (table, configuration) pair is written and read back in a fresh
+process, so the reported peak Arrow memory is that of the load, write and
+read alone rather than whatever the parent process has accumulated. Results go to a
+JSON file, one record per measurement, for comparison across machines and
+releases.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import json
+import multiprocessing
+import tempfile
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+_FLOATS = ["mean", "std_dev"]
+_LABELS = ["nuclide", "score"]
+
+CONFIGS = {
+    "none": dict(compression="none"),
+    "snappy": dict(compression="snappy"),
+    "lz4": dict(compression="lz4"),
+    "zstd-1": dict(compression="zstd", compression_level=1),
+    "zstd-3": dict(compression="zstd", compression_level=3),
+    "zstd-9": dict(compression="zstd", compression_level=9),
+    "snappy-nodict": dict(compression="snappy", use_dictionary=False),
+    "zstd-3-nodict": dict(
+        compression="zstd", compression_level=3, use_dictionary=False
+    ),
+    # dictionary-encode only the label columns, never the unique float results
+    "zstd-3-labeldict": dict(
+        compression="zstd", compression_level=3, use_dictionary=_LABELS
+    ),
+    # BYTE_STREAM_SPLIT only applies to columns that are not dictionary-encoded
+    "snappy-bss": dict(
+        compression="snappy", use_dictionary=_LABELS, use_byte_stream_split=_FLOATS
+    ),
+    "zstd-3-bss": dict(
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=_LABELS,
+        use_byte_stream_split=_FLOATS,
+    ),
+}
+
+
+def synthetic_tally(nx, ny, nz, scores=("flux", "fission"), seed=0) -> pa.Table:
+    """A mesh tally table shaped like :func:`recore.tally_io.tally_table` output.
+
+    The mean follows a smooth cosine shape with 1 % noise and ``std_dev`` is a
+    noisy ~1 % of it, which compresses like real Monte Carlo results (unlike
+    uniform random numbers).
+    """
+    rng = np.random.default_rng(seed)
+    ix, iy, iz = np.indices((nx, ny, nz), dtype=np.int32).reshape(3, -1, order="F")
+    shape = (
+        np.cos(np.pi * (ix + 0.5 - nx / 2) / (nx + 1))
+        * np.cos(np.pi * (iy + 0.5 - ny / 2) / (ny + 1))
+        * np.cos(np.pi * (iz + 0.5 - nz / 2) / (nz + 1))
+    )
+    n_scores = len(scores)
+    mean = np.repeat(shape, n_scores) * (
+        1 + 0.01 * rng.standard_normal(shape.size * n_scores)
+    )
+    std = np.abs(mean) * 0.01 * (1 + 0.1 * rng.standard_normal(mean.size))
+    codes = np.tile(np.arange(n_scores, dtype=np.int32), shape.size)
+    return pa.table(
+        {
+            "mesh_1_x": np.repeat(ix, n_scores),
+            "mesh_1_y": np.repeat(iy, n_scores),
+            "mesh_1_z": np.repeat(iz, n_scores),
+            "nuclide": pa.DictionaryArray.from_arrays(
+                np.zeros(mean.size, dtype=np.int32), pa.array(["total"])
+            ),
+            "score": pa.DictionaryArray.from_arrays(codes, pa.array(list(scores))),
+            "mean": mean,
+            "std_dev": std,
+        }
+    )
+
+
+def _measure(source, config, repeat):
+    # Runs in a fresh process: load the table, then time write and read.
+    # ru_maxrss barely moves once the interpreter is up, so peak memory is
+    # the high-water mark of the Arrow pool, where every buffer lives.
+    pool = pa.default_memory_pool()
+    baseline = pool.bytes_allocated()
+    table = feather.read_table(source, memory_map=False)
+    target = Path(source).with_suffix(".parquet")
+    write = read = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pq.write_table(table, target, **CONFIGS[config])
+        write = min(write, time.perf_counter() - start)
+        start = time.perf_counter()
+        pq.read_table(target)
+        read = min(read, time.perf_counter() - start)
+    return {
+        "write_s": write,
+        "read_s": read,
+        "file_bytes": target.stat().st_size,
+        "peak_bytes": pool.max_memory() - baseline,
+    }
+
+
+def run_suite(tables, configs=tuple(CONFIGS), repeat=3, out=None):
+    """Measure every config on every table in ``tables`` (a name → table dict).
+
+    Returns one record per (table, config) with rows, raw (Arrow) bytes, file
+    size, compression ratio, write/read throughput in MB/s of raw data and
+    the peak Arrow memory (the loaded table itself included, so compare
+    configs on the same table). If ``out`` is given the records are written there as
+    JSON.
+    """
+    spawn = multiprocessing.get_context("spawn")
+    records = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, table in tables.items():
+            source = Path(tmp) / f"{name}.arrow"
+            feather.write_feather(table, source, compression="uncompressed")
+            for config in configs:
+                with ProcessPoolExecutor(1, mp_context=spawn) as pool:
+                    m = pool.submit(_measure, source, config, repeat).result()
+                raw = table.nbytes
+                records.append(
+                    {
+                        "table": name,
+                        "rows": table.num_rows,
+                        "config": config,
+                        "raw_bytes": raw,
+                        "file_bytes": m["file_bytes"],
+                        "ratio": raw / m["file_bytes"],
+                        "write_mb_s": raw / 1e6 / m["write_s"],
+                        "read_mb_s": raw / 1e6 / m["read_s"],
+                        "peak_bytes": m["peak_bytes"],
+                    }
+                )
+    if out is not None:
+        Path(out).write_text(json.dumps(records, indent=1))
+    return records
+
+
+def default_tables():
+    """Synthetic mesh tallies from 10^3 to 10^6 bins (two scores each)."""
+    return {
+        "mesh_10x10x10": synthetic_tally(10, 10, 10),
+        "mesh_50x50x40": synthetic_tally(50, 50, 40),
+        "mesh_100x100x100": synthetic_tally(100, 100, 100),
+    }
+
+
+def format_records(records):
+    width = max([len("config"), *(len(r["config"]) for r in records)]) + 2
+    lines = [
+        f"{'table':<18}{'config':<{width}}{'ratio':>7}{'write MB/s':>12}{'read MB/s':>11}{'peak MB':>9}"
+    ]
+    for r in records:
+        lines.append(
+            f"{r['table']:<18}{r['config']:<{width}}{r['ratio']:>7.2f}"
+            f"{r['write_mb_s']:>12.0f}{r['read_mb_s']:>11.0f}{r['peak_bytes'] / 1e6:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Parquet codec/encoding benchmark")
+    ap.add_argument("-o", "--out", type=Path, default=Path("codec_benchmark.json"))
+    ap.add_argument("--repeat", type=int, default=3)
+    ns = ap.parse_args()
+
+    print(format_records(run_suite(default_tables(), repeat=ns.repeat, out=ns.out)))
@@ -0,0 +1,44 @@
+"""Synthetic statepoint files shared by the test modules."""
+
+import h5py
+import numpy as np
+
+
+def mesh_tally_statepoint(path, dimension, scores, n=10):
+    """Minimal statepoint with one ``flux_mesh`` tally; returns its raw results."""
+    rng = np.random.default_rng(0)
+    bins = int(np.prod(dimension))
+    results = rng.random((bins, len(scores), 2))
+    with h5py.File(path, "w") as f:
+        f["tallies/ids"] = [1]
+        tally = f.create_group("tallies/tally 1")
+        tally["name"] = b"flux_mesh"
+        tally["filters"] = [1]
+        tally["score_bins"] = [s.encode() for s in scores]
+        tally["nuclides"] = [b"total"]
+        tally["n_realizations"] = n
+        tally["results"] = results
+        f["tallies/filters/filter 1/type"] = b"mesh"
+        f["tallies/filters/filter 1/bins"] = [1]
+        f["tallies/filters/filter 1/n_bins"] = bins
+        mesh = f.create_group("tallies/meshes/mesh 1")
+        mesh["dimension"] = dimension
+        mesh["lower_left"] = [-1.0, -1.0, -1.0]
+        mesh["upper_right"] = [1.0, 1.0, 1.0]
+    return results
+
+
+def history_statepoint(path, k, n_inactive=2, per_batch=1, entropy=True):
+    """Statepoint with only the root datasets that :mod:`recore.convergence` reads."""
+    n = len(k) // per_batch - n_inactive
+    with h5py.File(path, "w") as f:
+        f["k_generation"] = k
+        if entropy:
+            f["entropy"] = np.linspace(1.0, 2.0, len(k))
+        f["generations_per_batch"] = per_batch
+        f["n_inactive"] = n_inactive
+        f["n_realizations"] = n
+        f["k_combined"] = [1.1, 0.01]
+        # k-collision, k-absorption, k-tracklength, leakage: value, sum, sum_sq
+        f["global_tallies"] = [[0, 0, 0]] * 3 + [[0, 0.2 * n, 0.04 * n]]
+        f["tallies/ids"] = []  # never read
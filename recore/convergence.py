@@ -0,0 +1,225 @@
+"""
+Batch-by-batch convergence history of many statepoints as one table.
+
+``openmc.StatePoint`` is far too heavy for this: it parses the whole file,
+tallies and summary included, just to get at ``k_generation``. Here each
+statepoint is opened with h5py and only the small root datasets are read:
+``k_generation``, ``entropy`` (when Shannon entropy was on),
+``global_tallies`` and the batch counters. Statepoints are read on a
+process pool, and the per-file arrays are stitched into a single Arrow
+table with one row per generation:
+
+``run, batch, generation, k_generation, entropy, k_mean, k_std``
+followed by the final ``k_combined``, ``k_combined_std``, ``leakage``
+and ``leakage_std`` of the run, repeated on each of its rows.
+
+``k_mean``/``k_std`` are the running mean and its standard deviation over
+the active batches up to and including ``batch`` (batch k is the mean of
+its generations, as OpenMC does). They are NaN for inactive batches.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import os
+
+import h5py
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from recore.tally_io import latest_statepoint, parquet_options
+
+LEAKAGE = 3  # row of "leakage" in the global_tallies dataset
+COLUMNS = (
+    "batch",
+    "generation",
+    "k_generation",
+    "entropy",
+    "k_mean",
+    "k_std",
+    "k_combined",
+    "k_combined_std",
+    "leakage",
+    "leakage_std",
+)
+
+
+def _scalar(f, name, default):
+    return f[name][()] if name in f else default
+
+
+def _running_stats(k_batch, n_inactive):
+    mean = np.full(k_batch.size, np.nan)
+    std = np.full(k_batch.size, np.nan)
+    active = k_batch[n_inactive:]
+    if active.size:
+        n = np.arange(1, active.size + 1)
+        mean[n_inactive:] = np.cumsum(active) / n
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = (np.cumsum(active**2) / n - mean[n_inactive:] ** 2) / (n - 1)
+        std[n_inactive:] = np.sqrt(np.maximum(var, 0.0))
+        std[n_inactive] = np.nan  # one realization has no spread
+    return mean, std
+
+
+def _estimates(f):
+    # (k_combined, leakage) as (mean, std) pairs; NaN before any active batch
+    n = int(_scalar(f, "n_realizations", 0))
+    k_combined = _scalar(f, "k_combined", [np.nan, np.nan])
+    leakage = np.nan, np.nan
+    if "global_tallies" in f and n > 0:
+        _, total, total_sq = f["global_tallies"][LEAKAGE]
+        mean = total / n
+        var = (total_sq / n - mean**2) / (n - 1) if n > 1 else np.nan
+        leakage = mean, np.sqrt(max(var, 0.0))
+    return (float(k_combined[0]), float(k_combined[1])), leakage
+
+
+def summary(statepoint):
+    """Final k-eff and leakage of ``statepoint`` (no tally or history read)."""
+    with h5py.File(statepoint, "r") as f:
+        (keff, keff_std), (leakage, leakage_std) = _estimates(f)
+        batches = int(_scalar(f, "current_batch", 0))
+    return {
+        "keff": keff,
+        "keff_std": keff_std,
+        "leakage": float(leakage),
+        "leakage_std": float(leakage_std),
+        "batches": batches,
+    }
+
+
+def read_history(statepoint):
+    """Convergence arrays of one statepoint as a dict of column → ndarray."""
+    with h5py.File(statepoint, "r") as f:
+        k_gen = np.asarray(_scalar(f, "k_generation", np.empty(0)), dtype=np.float64)
+        entropy = np.asarray(_scalar(f, "entropy", np.empty(0)), dtype=np.float64)
+        per_batch = int(_scalar(f, "generations_per_batch", 1))
+        n_inactive = int(_scalar(f, "n_inactive", 0))
+        k_combined, leakage = _estimates(f)
+
+    n_batches = k_gen.size // per_batch
+    k_gen = k_gen[: n_batches * per_batch]
+    k_mean, k_std = _running_stats(
+        k_gen.reshape(-1, per_batch).mean(axis=1), n_inactive
+    )
+    if entropy.size < k_gen.size:
+        entropy = np.concatenate([entropy, np.full(k_gen.size - entropy.size, np.nan)])
+    batch = np.repeat(np.arange(n_batches), per_batch)
+    rows = k_gen.size
+    return {
+        "batch": (batch + 1).astype(np.int32),
+        "generation": np.arange(1, rows + 1, dtype=np.int32),
+        "k_generation": k_gen,
+        "entropy": entropy[:rows],
+        "k_mean": k_mean[batch],
+        "k_std": k_std[batch],
+        "k_combined": np.full(rows, float(k_combined[0])),
+        "k_combined_std": np.full(rows, float(k_combined[1])),
+        "leakage": np.full(rows, float(leakage[0])),
+        "leakage_std": np.full(rows, float(leakage[1])),
+    }
+
+
+def history_table(statepoints, runs=None, workers=None) -> pa.Table:
+    """One convergence table for all ``statepoints``, read on ``workers`` processes.
+
+    ``runs`` names each statepoint in the ``run`` column (default: the path).
+    """
+    statepoints = [Path(p) for p in statepoints]
+    runs = list(runs) if runs is not None else [str(p) for p in statepoints]
+    if len(statepoints) > 1 and workers != 1:
+        workers = workers or os.cpu_count()
+        chunk = max(1, len(statepoints) // (4 * workers))  # few round trips
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            histories = list(pool.map(read_history, statepoints, chunksize=chunk))
+    else:
+        histories = [read_history(p) for p in statepoints]
+
+    sizes = [h["generation"].size for h in histories]
+    columns = {
+        "run": pa.DictionaryArray.from_arrays(
+            np.repeat(np.arange(len(runs), dtype=np.int32), sizes), pa.array(runs)
+        )
+    }
+    for name in COLUMNS:
+        columns[name] = np.concatenate(
+            [h[name] for h in histories] or [np.empty(0, dtype=np.float64)]
+        )
+    return pa.table(columns)
+
+
+def sweep_statepoints(root):
+    """Latest statepoint of every directory under ``root``, with run names.
+
+    A run that was extended keeps its whole history in the newest file, so
+    older statepoints in the same directory are skipped.
+    """
+    root = Path(root)
+    dirs = sorted({p.parent for p in root.rglob("statepoint.*.h5")})
+    found = [(d, latest_statepoint(d)) for d in dirs]
+    names = [
+        "__".join(d.relative_to(root).parts) or root.resolve().name for d, _ in found
+    ]
+    return [sp for _, sp in found], names
+
+
+def sweep_history(root, workers=None) -> pa.Table:
+    """Convergence table of every run directory under ``root``."""
+    statepoints, runs = sweep_statepoints(root)
+    return history_table(statepoints, runs, workers)
+
+
+def write_history(table, path):
+    pq.write_table(table, path, **parquet_options(table.schema))
+    return Path(path)
+
+
+def plot_history(table, save=None, show=False):
+    """k-eff per generation (faint) and its running mean ± σ for every run."""
+    import matplotlib
+
+    if not show:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    frame = table.to_pandas()
+    fig, ax = plt.subplots()
+    for run, rows in frame.groupby("run", observed=True, sort=False):
+        (line,) = ax.plot(rows["generation"], rows["k_generation"], alpha=0.25, lw=0.8)
+        ax.plot(rows["generation"], rows["k_mean"], color=line.get_color(), label=run)
+        ax.fill_between(
+            rows["generation"],
+            rows["k_mean"] - rows["k_std"],
+            rows["k_mean"] + rows["k_std"],
+            color=line.get_color(),
+            alpha=0.2,
+        )
+    ax.set_xlabel("Generation")
+    ax.set_ylabel("k-effective")
+    if frame["run"].nunique() <= 10:
+        ax.legend(fontsize="small")
+    fig.tight_layout()
+    if save:
+        fig.savefig(save)
+    if show:
+        plt.show()
+    return fig
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Convergence history of a sweep tree")
+    ap.add_argument("root", type=Path, help="run directory or tree of them")
+    ap.add_argument("-o", "--out", type=Path, default=Path("convergence.parquet"))
+    ap.add_argument("-j", "--workers", type=int, default=None)
+    ap.add_argument("--plot", type=Path, help="also save a k-eff plot here")
+    ns = ap.parse_args()
+
+    table = sweep_history(ns.root, ns.workers)
+    write_history(table, ns.out)
+    print(
+        f"✅  {table.num_rows} generations of {len(set(table['run'].to_pylist()))} runs → {ns.out}"
+    )
+    if ns.plot:
+        plot_history(table, save=ns.plot)
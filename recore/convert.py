@@ -0,0 +1,171 @@
+"""
+Convert every statepoint under a directory tree to one partitioned dataset.
+
+Each ``statepoint.*.h5`` becomes its own ``run=`` partition (see
+:func:`recore.tally_io.export_partitioned`), named after its path relative
+to the source root. A ``manifest.json`` in the output records the size,
+mtime and SHA-256 of every converted source, so re-running the converter
+over a sweep directory only touches new or changed statepoints. The
+manifest is saved as conversions finish, so an interrupted or partly failed
+run keeps what it converted; sources that have disappeared are dropped from
+it together with their partitions.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from recore.tally_io import export_partitioned
+
+MANIFEST = "manifest.json"
+SAVE_INTERVAL = 1.0  # s between manifest saves while conversions finish
+
+
+def file_digest(path, block=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(block):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def run_name(path, src_root):
+    """Partition value for ``path``: its relative path with separators as ``__``."""
+    rel = Path(path).relative_to(src_root).with_suffix("")
+    return "__".join(rel.parts)
+
+
+def _convert_one(path, src_root, out_root, digest):
+    digest = digest or file_digest(path)
+    files = export_partitioned(path, out_root, run_name(path, src_root))
+    return digest, [str(Path(f).relative_to(out_root)) for f in files]
+
+
+def _load_manifest(out_root):
+    path = Path(out_root) / MANIFEST
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def _save_manifest(out_root, manifest):
+    # written to a temp file and renamed, so a crash never leaves half a manifest
+    fd, tmp = tempfile.mkstemp(dir=out_root, suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, Path(out_root) / MANIFEST)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def convert_tree(src_root, out_root, workers=None, force=False):
+    """Convert new or changed statepoints under ``src_root`` into ``out_root``.
+
+    A source is skipped when its size and mtime match the manifest, or when
+    they changed but its SHA-256 did not. Sources in the manifest that no
+    longer exist are removed along with their ``run=`` partitions.
+    Conversions run on a process pool of ``workers`` processes; one that
+    fails does not stop the others and is reported under ``failed``
+    (source → error) instead. Returns a summary dict with counts, bytes,
+    elapsed seconds, throughput and the failures.
+    """
+    src_root, out_root = Path(src_root), Path(out_root)
+    out_root.mkdir(parents=True, exist_ok=True)
+    manifest = _load_manifest(out_root)
+    sources = {
+        str(path.relative_to(src_root)): path
+        for path in sorted(src_root.rglob("statepoint.*.h5"))
+    }
+
+    start = time.perf_counter()
+    removed = [key for key in manifest if key not in sources]
+    for key in removed:
+        del manifest[key]
+        shutil.rmtree(
+            out_root / f"run={run_name(src_root / key, src_root)}", ignore_errors=True
+        )
+
+    todo = []
+    skipped = 0
+    for key, path in sources.items():
+        stat = path.stat()
+        entry = None if force else manifest.get(key)
+        if entry is None:  # new: hashed by the worker alongside the conversion
+            todo.append((path, key, stat, None))
+            continue
+        if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            skipped += 1
+            continue
+        digest = file_digest(path)
+        if entry["sha256"] == digest:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            skipped += 1
+            continue
+        todo.append((path, key, stat, digest))
+
+    failed = {}
+    n_bytes = 0
+    saved = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_convert_one, path, src_root, out_root, digest): (key, stat)
+            for path, key, stat, digest in todo
+        }
+        for future in as_completed(futures):
+            key, stat = futures[future]
+            try:
+                digest, files = future.result()
+            except Exception as e:
+                failed[key] = f"{type(e).__name__}: {e}"
+                manifest.pop(key, None)  # its partition may be half rewritten
+                continue
+            manifest[key] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": digest,
+                "files": files,
+            }
+            n_bytes += stat.st_size
+            if time.perf_counter() - saved > SAVE_INTERVAL:
+                _save_manifest(out_root, manifest)
+                saved = time.perf_counter()
+
+    _save_manifest(out_root, manifest)
+    elapsed = time.perf_counter() - start
+    converted = len(todo) - len(failed)
+    return {
+        "converted": converted,
+        "skipped": skipped,
+        "removed": len(removed),
+        "failed": failed,
+        "bytes": n_bytes,
+        "seconds": elapsed,
+        "mb_per_s": n_bytes / 1e6 / elapsed if elapsed else 0.0,
+        "files_per_s": converted / elapsed if elapsed else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Bulk statepoint → Parquet converter")
+    ap.add_argument("src", type=Path, help="directory tree holding statepoint.*.h5")
+    ap.add_argument("out", type=Path, help="partitioned dataset root")
+    ap.add_argument("-j", "--workers", type=int, default=None)
+    ap.add_argument("--force", action="store_true", help="ignore the manifest")
+    ns = ap.parse_args()
+
+    s = convert_tree(ns.src, ns.out, ns.workers, ns.force)
+    print(
+        f"✅  {s['converted']} converted, {s['skipped']} unchanged, "
+        f"{s['removed']} removed in {s['seconds']:.2f}s "
+        f"({s['mb_per_s']:.1f} MB/s, {s['files_per_s']:.1f} files/s)"
+    )
+    for key, error in s["failed"].items():
+        print(f"❌  {key}: {error}")
+    sys.exit(1 if s["failed"] else 0)
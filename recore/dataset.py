@@ -4,28 +4,165 @@ Convert an OpenMC statepoint (HDF5) to compressed Parquet.
 
 from pathlib import Path
 import argparse
+import time
+import numpy as np
 import openmc
 import pyarrow as pa
+import pyarrow.dataset as pds
 import pyarrow.parquet as pq
 
+from recore import codec_bench
+from recore.tally_io import (
+    MeshTally,
+    export_partitioned,
+    latest_statepoint,
+    parquet_options,
+    tally_ids,
+    tally_table,
+)
+
 
 class Dataset:
+    """Wrap a statepoint and expose quick Parquet I/O."""
+
     def __init__(self, statepoint: Path):
+        # A run directory resolves to its newest statepoint, e.g. after extend_run
+        if Path(statepoint).is_dir():
+            statepoint = latest_statepoint(statepoint)
+        self.path = Path(statepoint)
         self.sp = openmc.StatePoint(statepoint)
 
-    def to_parquet(self, outfile: Path = Path("results.parquet")) -> Path:
-        df = self.sp.tallies[1].get_pandas_dataframe()  # flux tally
-        pq.write_table(pa.Table.from_pandas(df), outfile, compression="snappy")
+    def to_parquet(
+        self, outfile: Path = Path("results.parquet"), tally_id=1, method="arrow"
+    ) -> Path:
+        """Write one tally (default: the flux tally, ID 1) to Parquet.
+
+        ``method="arrow"`` builds the table straight from the HDF5 arrays with
+        :func:`recore.tally_io.tally_table`; ``"pandas"`` is the original
+        ``get_pandas_dataframe`` route, kept for comparison.
+        """
+        if method == "arrow":
+            table = tally_table(self.path, tally_id)
+        elif method == "pandas":
+            df = self.sp.tallies[tally_id].get_pandas_dataframe()
+            table = pa.Table.from_pandas(df)
+        else:
+            raise ValueError(f"Unknown method {method!r}; use 'arrow' or 'pandas'")
+        pq.write_table(table, outfile, **parquet_options(table.schema))
         return outfile
 
+    def to_partitioned(self, root: Path = Path("results"), run=None) -> list:
+        """Export all tallies as a run/tally/score Hive-partitioned dataset."""
+        return export_partitioned(self.path, root, run)
+
+    @staticmethod
+    def benchmark(
+        sp_path: Path,
+        methods=("pandas", "arrow"),
+        out: Path = Path("codec_benchmark.json"),
+        synthetic=True,
+    ):
+        """Benchmark conversion on ``sp_path`` and print the results.
+
+        First times each ``to_parquet`` method, then runs the
+        :mod:`recore.codec_bench` codec/encoding suite over every tally in the
+        statepoint (plus synthetic meshes of increasing size when
+        ``synthetic``), writing the per-codec records to ``out`` as JSON.
+        """
+        sp_path = Path(sp_path)
+        size_h5 = sp_path.stat().st_size
+        dset = Dataset(sp_path)
+        timings = {}
+        for method in methods:
+            start = time.perf_counter()
+            parquet = dset.to_parquet(
+                sp_path.with_suffix(f".{method}.parquet"), method=method
+            )
+            timings[method] = time.perf_counter() - start
+            size_parq = parquet.stat().st_size
+            print(
+                f"{method:>6}: converted in {timings[method]:.2f}s → "
+                f"HDF5 {size_h5/1e3:.1f} kB → Parquet {size_parq/1e3:.1f} kB"
+            )
+
+        tables = {f"tally_{i}": tally_table(sp_path, i) for i in tally_ids(sp_path)}
+        if synthetic:
+            tables.update(codec_bench.default_tables())
+        records = codec_bench.run_suite(tables, out=out)
+        print(codec_bench.format_records(records))
+        return {"methods": timings, "codecs": records}
+
+    def mesh_to_parquet(
+        self,
+        outfile: Path = Path("mesh.parquet"),
+        name="flux_mesh",
+        score="flux",
+        chunk=1,
+    ) -> Path:
+        """Write a mesh tally as (ix, iy, iz, mean, std_dev) rows, ``chunk`` z-planes per row group.
+
+        Only one chunk of the tally is in memory at a time, so this scales to
+        meshes far larger than RAM would allow through :meth:`to_parquet`.
+        """
+        with MeshTally(self.path, name) as mesh, pq.ParquetWriter(
+            outfile, _MESH_SCHEMA, **parquet_options(_MESH_SCHEMA)
+        ) as writer:
+            for z0, mean, std in mesh.slabs(chunk, score):
+                ix, iy, iz = np.indices(mean.shape, dtype=np.int32).reshape(3, -1)
+                columns = [ix, iy, iz + np.int32(z0), mean.ravel(), std.ravel()]
+                writer.write_table(pa.Table.from_arrays(columns, schema=_MESH_SCHEMA))
+        return outfile
+
+
+def open_results(root: Path = Path("results")) -> pds.Dataset:
+    """Open a :meth:`Dataset.to_partitioned` tree for filtered scans.
+
+    e.g. ``open_results().to_table(filter=(pds.field("tally") == 1) &
+    (pds.field("score") == "flux"))`` touches only that tally's flux file.
+    """
+    return pds.dataset(root, format="parquet", partitioning="hive")
+
+
+_MESH_SCHEMA = pa.schema(
+    [
+        ("ix", pa.int32()),
+        ("iy", pa.int32()),
+        ("iz", pa.int32()),
+        ("mean", pa.float64()),
+        ("std_dev", pa.float64()),
+    ]
+)
+
 
 if __name__ == "__main__":
     ap = argparse.ArgumentParser(description="HDF5 → Parquet converter")
-    ap.add_argument("statepoint", type=Path)
+    ap.add_argument("statepoint", type=Path, help="statepoint file or run directory")
     ap.add_argument("-o", "--out", type=Path, default=Path("results.parquet"))
+    ap.add_argument(
+        "--mesh", metavar="TALLY", help="stream this mesh tally out in z-slabs"
+    )
+    ap.add_argument(
+        "--partitioned",
+        action="store_true",
+        help="write every tally to a run/tally/score dataset under --out",
+    )
+    ap.add_argument(
+        "--benchmark", action="store_true", help="compare the pandas and arrow paths"
+    )
     ns = ap.parse_args()
 
-    out = Dataset(ns.statepoint).to_parquet(ns.out)
-    h5_size = ns.statepoint.stat().st_size / 1024
+    ds = Dataset(ns.statepoint)
+    if ns.benchmark:
+        Dataset.benchmark(ds.path)
+        raise SystemExit
+    if ns.partitioned:
+        files = ds.to_partitioned(ns.out)
+        print(f"✅  Wrote {len(files)} partitions under {ns.out}")
+        raise SystemExit
+    if ns.mesh:
+        out = ds.mesh_to_parquet(ns.out, name=ns.mesh)
+    else:
+        out = ds.to_parquet(ns.out)
+    h5_size = ds.path.stat().st_size / 1024
     pq_size = out.stat().st_size / 1024
     print(f"✅  Wrote {out}  ({h5_size:.1f} kB → {pq_size:.1f} kB)")
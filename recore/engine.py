@@ -0,0 +1,122 @@
+"""
+Keep one OpenMC instance loaded in-process for repeated pin-cell runs.
+
+``openmc.run`` starts a fresh executable that re-parses the XML and reloads
+every cross section on each call. :class:`Engine` pays that once through
+``openmc.lib`` and then reruns the same model with different fuel
+composition, particles/batches or tally scores, reading results straight
+from memory. ``openmc.lib`` is a per-process singleton, so use
+:func:`get_engine` to share one engine per (worker) process.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import openmc
+import openmc.lib
+
+from recore.openmc_run import pincell_model
+
+FUEL_ID = 1  # pincell_model resets IDs, so the fuel is always material 1
+TALLY_ID = 1  # ... and the flux_mesh tally is always tally 1
+
+
+class Engine:
+    """An initialized ``openmc.lib`` session holding the pin-cell model.
+
+    Geometry (``fuel_r``, ``pitch``) is fixed for the life of the engine;
+    enrichment, fuel density, particles, batches and tally scores can change
+    between runs. Only one engine can be open per process: constructing a
+    second one before closing the first raises RuntimeError.
+    """
+
+    def __init__(self, workdir="engine", threads=1, fuel_r=0.4, pitch=1.3, enrich=15.0):
+        global _ENGINE
+        if _ENGINE is not None:
+            raise RuntimeError(
+                "openmc.lib is already initialized in this process; "
+                "use get_engine() or close the open Engine first"
+            )
+        self.workdir = Path(workdir)
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        self.enrich = enrich
+        pincell_model(fuel_r, pitch, enrich).export_to_xml(self.workdir)
+        openmc.lib.init(args=["-s", str(threads), str(self.workdir)], output=False)
+        _ENGINE = self
+
+    def set_enrichment(self, enrich, density=19.1):
+        """Replace the fuel's uranium vector with ``enrich`` wt% U235."""
+        fuel = openmc.Material()
+        fuel.add_element("U", 1.0, enrichment=enrich)
+        fuel.set_density("g/cm3", density)
+        atoms = fuel.get_nuclide_atom_densities()
+        openmc.lib.materials[FUEL_ID].set_densities(
+            list(atoms), [float(n) for n in atoms.values()]
+        )
+        self.enrich = enrich
+
+    def set_density(self, density):
+        """Fuel density in g/cm3, keeping the current isotopic vector."""
+        openmc.lib.materials[FUEL_ID].set_density(density, "g/cm3")
+
+    def set_scores(self, scores):
+        """Scores of the flux_mesh tally for subsequent runs, e.g. ``["flux", "fission"]``."""
+        openmc.lib.tallies[TALLY_ID].scores = list(scores)
+
+    def run(self, particles=None, batches=None, inactive=None):
+        """Rerun from a clean slate and return k-eff plus the mesh tally.
+
+        The random number stream is reset too, so identical inputs give
+        identical results. Returns a dict with ``keff``, ``keff_std`` and the
+        tally ``mean``/``std_dev`` as ``(mesh bins, scores)`` arrays.
+        """
+        settings = openmc.lib.settings
+        if particles is not None:
+            settings.particles = particles
+        if batches is not None:
+            settings.batches = batches
+        if inactive is not None:
+            settings.inactive = inactive
+        openmc.lib.hard_reset()
+        openmc.lib.run(output=False)
+
+        keff, keff_std = openmc.lib.keff()
+        tally = openmc.lib.tallies[TALLY_ID]
+        n_scores = len(tally.scores)
+        return {
+            "keff": keff,
+            "keff_std": keff_std,
+            "mean": np.reshape(tally.mean, (-1, n_scores)),
+            "std_dev": np.reshape(tally.std_dev, (-1, n_scores)),
+        }
+
+    def write_statepoint(self, path=None):
+        """Write the last run to an ordinary statepoint file and return its path.
+
+        The default name is numbered by batch like OpenMC's own, so
+        :func:`recore.tally_io.latest_statepoint` and the converters pick it up.
+        """
+        batches = openmc.lib.settings.batches
+        path = Path(path or self.workdir / f"statepoint.{batches:03d}.h5")
+        openmc.lib.statepoint_write(str(path))
+        return path
+
+    def close(self):
+        global _ENGINE
+        if _ENGINE is self:  # get_engine() must not hand out a finalized engine
+            openmc.lib.finalize()
+            _ENGINE = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_ENGINE = None  # the open Engine of this process, if any
+
+
+def get_engine(**kwargs):
+    """The process-wide :class:`Engine`, created on first use with ``kwargs``."""
+    return _ENGINE or Engine(**kwargs)
@@ -13,6 +13,11 @@ import openmc
 import io
 import contextlib
 
+from recore.catalog import RunCatalog
+from recore.convergence import history_table, summary
+from recore.tally_io import latest_statepoint
+from recore.telemetry import read_metrics
+
 
 def download_nuclear_data():
     """Download nuclear data if not present."""
@@ -99,20 +104,29 @@ def run_smoke_with_output():
 
 def run_analysis_with_output(filename=None):
     """Run analysis and capture both summary and full output."""
-    # Placeholder for actual analysis logic
     buf = io.StringIO()
-    summary = ""
+    status = ""
     with contextlib.redirect_stdout(buf):
         try:
-            # Simulate analysis output
-            print("k-effective: 0.02589 ± 0.00020")
-            print("leakage fraction: 0.98889 ± 0.00078")
-            print("statepoint file:", filename)
-            summary = "✅ Analysis completed successfully!"
+            results = run_analysis()
+            if results is None:
+                status = "❌ No statepoint in run/ yet. Run a simulation first."
+            else:
+                print(
+                    f"k-effective: {results['k_effective']:.5f} ± {results['confidence']:.5f}"
+                )
+                print(
+                    f"leakage fraction: {results['leakage_fraction']:.5f} ± "
+                    f"{results['leakage_std']:.5f}"
+                )
+                print("statepoint file:", results["statepoint"])
+                if filename:
+                    print("uploaded:", filename)
+                status = "✅ Analysis completed successfully!"
         except Exception as e:
-            summary = f"❌ Error: {str(e)}"
+            status = f"❌ Error: {str(e)}"
     full_output = buf.getvalue()
-    return summary, full_output
+    return status, full_output
 
 
 def create_app():
@@ -145,6 +159,15 @@ def create_app():
                                                         id="run-smoke-test",
                                                         n_clicks=0,
                                                     ),
+                                                    html.Div(
+                                                        id="smoke-progress",
+                                                        style={"fontSize": "12px"},
+                                                    ),
+                                                    dcc.Interval(
+                                                        id="progress-poll",
+                                                        interval=1000,
+                                                        disabled=True,
+                                                    ),
                                                     html.Hr(style={"margin": "10px 0"}),
                                                     html.H3("Analysis"),
                                                     html.P(
@@ -329,6 +352,8 @@ def create_app():
             Input("download-sample", "n_clicks"),
         ],
         [State("upload-data", "filename")],
+        # poll run/metrics.jsonl only while a run may be writing it
+        running=[(Output("progress-poll", "disabled"), False, True)],
     )
     def update_home_output(
         smoke_clicks, analysis_clicks, sample_clicks, uploaded_filename
@@ -379,6 +404,20 @@ def create_app():
             )
         return ""
 
+    # Live progress of the OpenMC run in run/ (the poll only runs meanwhile)
+    @app.callback(
+        Output("smoke-progress", "children"), Input("progress-poll", "n_intervals")
+    )
+    def update_smoke_progress(_):
+        records = read_metrics("run")
+        if not records:
+            return ""
+        m = records[-1]
+        return (
+            f"Batch {m.batch}: k = {m.keff:.5f}, "
+            f"{m.rate:,.0f} particles/s, {m.elapsed:.1f} s elapsed"
+        )
+
     # Results context logic
     @app.callback(
         Output("results-context", "children"),
@@ -412,23 +451,10 @@ def create_app():
     def run_analysis_callback(n_clicks):
         if not n_clicks:
             return [go.Figure()]
-        # Placeholder: replace with actual analysis/visualization
-        fig = go.Figure()
-        fig.add_trace(
-            go.Scatter(
-                x=[0, 1, 2, 3, 4],
-                y=[0, 1, 4, 9, 16],
-                mode="lines+markers",
-                name="Simulation Results",
-            )
-        )
-        fig.update_layout(
-            title="Nuclear Simulation Results",
-            xaxis_title="Batch",
-            yaxis_title="k-effective",
-            showlegend=True,
-        )
-        return [fig]
+        statepoint = latest_statepoint("run")
+        if statepoint is None:
+            return [go.Figure()]
+        return [create_visualization(history_table([statepoint], ["run"], workers=1))]
 
     # Callback for export
     @app.callback(
@@ -451,27 +477,60 @@ def create_app():
     return app
 
 
-def run_analysis(contents):
-    """Run analysis on uploaded data."""
-    # TODO: Implement actual analysis
-    return {"k_effective": 0.02589, "leakage_fraction": 0.98889, "confidence": 0.00020}
-
-
-def create_visualization(results):
-    """Create visualization of simulation results."""
-    # TODO: Implement actual visualization
+def run_analysis(statepoint=None, catalog=None):
+    """k-effective and leakage of ``statepoint`` (default: the latest in run/).
+
+    Catalogued runs come straight from the run catalog; other statepoints
+    (sample data, uploads) are summarised from their root datasets. Returns
+    None when there is no statepoint.
+    """
+    statepoint = statepoint or latest_statepoint("run")
+    if statepoint is None:
+        return None
+    if catalog is None:
+        catalog = RunCatalog()
+    run = catalog.latest(statepoint=statepoint)
+    if run is None:
+        run = summary(statepoint)
+    return {
+        "k_effective": run["keff"],
+        "confidence": run["keff_std"],
+        "leakage_fraction": run["leakage"],
+        "leakage_std": run["leakage_std"],
+        "statepoint": str(statepoint),
+    }
+
+
+def create_visualization(history):
+    """k-effective vs generation, with the running mean ± σ, for each run.
+
+    ``history`` is a :func:`recore.convergence.history_table` table.
+    """
     fig = go.Figure()
-    fig.add_trace(
-        go.Scatter(
-            x=[0, 1, 2, 3, 4],
-            y=[0, 1, 4, 9, 16],
-            mode="lines+markers",
-            name="Simulation Results",
+    frame = history.to_pandas()
+    for run, rows in frame.groupby("run", observed=True, sort=False):
+        fig.add_trace(
+            go.Scatter(
+                x=rows["generation"],
+                y=rows["k_generation"],
+                mode="markers",
+                marker={"size": 4},
+                opacity=0.4,
+                name=f"{run} (generation)",
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=rows["generation"],
+                y=rows["k_mean"],
+                error_y={"type": "data", "array": rows["k_std"], "visible": True},
+                mode="lines",
+                name=f"{run} (running mean)",
+            )
         )
-    )
     fig.update_layout(
-        title="Nuclear Simulation Results",
-        xaxis_title="Batch",
+        title="k-effective Convergence",
+        xaxis_title="Generation",
         yaxis_title="k-effective",
         showlegend=True,
     )
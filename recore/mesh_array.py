@@ -0,0 +1,161 @@
+"""
+Store a mesh result as a self-describing, compact Parquet file.
+
+The file has just two float columns, ``mean`` and ``std_dev``, holding the
+array in C order in a single row group. The shape, the mesh extents and
+the score go in the schema metadata. A reader gets both ndarrays back from
+one contiguous read with the right coordinates, however wide the mesh.
+
+Next to each Parquet file sits an uncompressed Arrow IPC sidecar
+(``.arrow``) with the same columns and metadata. :func:`open_mesh_array`
+memory-maps it, so repeated dashboard renders, and every worker process,
+share the same page-cache pages with nothing to decode or copy. Both files
+are stamped with the size and mtime of the statepoint they came from; a
+stamp that no longer matches makes the sidecar stale.
+"""
+
+from pathlib import Path
+from typing import NamedTuple, Optional
+import json
+import os
+import tempfile
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from recore.tally_io import parquet_options
+
+SIDECAR_SUFFIX = ".arrow"
+
+
+class MeshArray(NamedTuple):
+    mean: np.ndarray
+    std_dev: Optional[np.ndarray]
+    lower_left: np.ndarray
+    upper_right: np.ndarray
+    score: str = "flux"
+
+    def centers(self):
+        """Bin-centre coordinates along each axis, one array per dimension."""
+        edges = [
+            np.linspace(lo, hi, n + 1)
+            for lo, hi, n in zip(self.lower_left, self.upper_right, self.mean.shape)
+        ]
+        return [(e[:-1] + e[1:]) / 2 for e in edges]
+
+
+def source_stamp(statepoint):
+    """Metadata identifying the exact ``statepoint`` file a result came from."""
+    if statepoint is None:
+        return {}
+    stat = Path(statepoint).stat()
+    return {
+        "source": Path(statepoint).name,
+        "source_size": str(stat.st_size),
+        "source_mtime_ns": str(stat.st_mtime_ns),
+    }
+
+
+def _table(mesh: MeshArray, source=None) -> pa.Table:
+    mean = np.ascontiguousarray(mesh.mean, dtype=np.float64)
+    columns = {"mean": mean.ravel()}
+    if mesh.std_dev is not None:
+        columns["std_dev"] = np.ascontiguousarray(mesh.std_dev, np.float64).ravel()
+    table = pa.table(columns).replace_schema_metadata(
+        {
+            "shape": json.dumps(list(mean.shape)),
+            "lower_left": json.dumps([float(v) for v in mesh.lower_left]),
+            "upper_right": json.dumps([float(v) for v in mesh.upper_right]),
+            "score": mesh.score,
+            **source_stamp(source),
+        }
+    )
+    return table
+
+
+def write_mesh_array(path, mesh: MeshArray, source=None) -> Path:
+    """Write ``mesh`` to ``path`` as one row group of mean/std_dev values.
+
+    Also writes the memory-mappable sidecar. ``source`` is the statepoint
+    the result was computed from; it is recorded for invalidation.
+    """
+    table = _table(mesh, source)
+    pq.write_table(
+        table,
+        path,
+        row_group_size=max(table.num_rows, 1),
+        **parquet_options(table.schema),
+    )
+    _write_sidecar(Path(path).with_suffix(SIDECAR_SUFFIX), table)
+    return Path(path)
+
+
+def _write_sidecar(path, table):
+    # A private temp file per writer, so concurrent rebuilds cannot clobber
+    # each other, and readers never see a half-written sidecar.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=SIDECAR_SUFFIX)
+    os.close(fd)
+    try:
+        with pa.OSFile(tmp, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _from_table(table) -> MeshArray:
+    meta = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()}
+    if "shape" not in meta:
+        raise ValueError("Not a mesh array file (wide legacy layout?); re-run analysis")
+    shape = json.loads(meta["shape"])
+
+    def column(name):
+        if name not in table.column_names:
+            return None
+        values = table[name]
+        # one-batch files (all we write) come back as views, not copies
+        values = values.chunk(0) if values.num_chunks == 1 else values.combine_chunks()
+        return values.to_numpy(zero_copy_only=False).reshape(shape)
+
+    return MeshArray(
+        column("mean"),
+        column("std_dev"),
+        np.array(json.loads(meta["lower_left"])),
+        np.array(json.loads(meta["upper_right"])),
+        meta.get("score", "flux"),
+    )
+
+
+def read_mesh_array(path) -> MeshArray:
+    """Read a :func:`write_mesh_array` Parquet file back into ndarrays."""
+    return _from_table(pq.read_table(path))
+
+
+def _stamp_matches(schema, source):
+    if source is None:
+        return True
+    meta = {k.decode(): v.decode() for k, v in (schema.metadata or {}).items()}
+    stamp = source_stamp(source)
+    return all(meta.get(k) == v for k, v in stamp.items())
+
+
+def open_mesh_array(path, source=None) -> Optional[MeshArray]:
+    """Memory-map the sidecar of the Parquet file ``path`` (zero-copy arrays).
+
+    With ``source`` (the current statepoint), a result computed from a
+    different statepoint is stale and None is returned. A missing or stale
+    sidecar for an up-to-date Parquet file is rebuilt from it first.
+    """
+    path = Path(path)
+    sidecar = path.with_suffix(SIDECAR_SUFFIX)
+    if sidecar.exists():
+        table = pa.ipc.open_file(pa.memory_map(str(sidecar))).read_all()
+        if _stamp_matches(table.schema, source):
+            return _from_table(table)
+    if not path.exists() or not _stamp_matches(pq.read_schema(path), source):
+        return None
+    _write_sidecar(sidecar, pq.read_table(path))
+    return _from_table(pa.ipc.open_file(pa.memory_map(str(sidecar))).read_all())
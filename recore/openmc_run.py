@@ -5,95 +5,314 @@ the generated statepoint file.
 
 from pathlib import Path
 import argparse
-import openmc
 import os
-import pandas as pd
-import numpy as np
+import time
+import openmc
 import plotly.graph_objects as go
 from dash import ctx
 
+from recore import telemetry
+from recore.cache import SimulationCache, detach, model_key, place
+from recore.catalog import RunCatalog
+from recore.mesh_array import open_mesh_array
+from recore.tally_io import latest_statepoint
+
+INACTIVE = 2  # inactive batches of every pin-cell run
+
+
+def pincell_model(
+    fuel_r=0.4,
+    pitch=1.3,
+    enrich=15.0,
+    particles=1_000,
+    batches=20,
+    flux_rel_err=None,
+    keff_std=None,
+    max_batches=None,
+    mesh_dimension=(10, 10, 1),
+    mesh_lower_left=None,
+    mesh_upper_right=None,
+    scores=("flux",),
+    min_batches=None,
+) -> openmc.Model:
+    """The pin-cell model, with IDs reset so identical inputs give identical XML.
+
+    The ``flux_mesh`` tally covers ``mesh_lower_left``..``mesh_upper_right``
+    (default: the whole cell) with ``mesh_dimension`` bins and records
+    ``scores``, e.g. ``("flux", "fission", "absorption")``.
+
+    Setting ``flux_rel_err`` (max relative error over the mesh-flux bins)
+    and/or ``keff_std`` turns on OpenMC triggers: the run stops as soon as
+    every target is met after ``min_batches`` (default: the inactive batches
+    plus one), and at the latest after ``max_batches`` (default ``batches``).
+    """
+    openmc.reset_auto_ids()
+
+    # ----- materials -----
+    fuel = openmc.Material(name="U‑Pu‑Zr fuel")
+    fuel.add_element("U", 1.0, enrichment=enrich)  # toy enrichment
+    fuel.set_density("g/cm3", 19.1)
+
+    clad = openmc.Material(name="HT9")
+    clad.add_element("Fe", 1.0)
+    clad.set_density("g/cm3", 7.8)
+
+    materials = openmc.Materials([fuel, clad])
+
+    # ----- geometry -----
+    fuel_cyl = openmc.ZCylinder(r=fuel_r)
+    clad_cyl = openmc.ZCylinder(r=fuel_r * 1.05)
+
+    # Add a bounding box with vacuum boundary
+    box = openmc.model.RectangularParallelepiped(
+        -pitch / 2,
+        pitch / 2,
+        -pitch / 2,
+        pitch / 2,
+        -1.0,
+        1.0,
+        boundary_type="vacuum",
+    )
+
+    cells = [
+        openmc.Cell(fill=fuel, region=-fuel_cyl & -box),
+        openmc.Cell(fill=clad, region=+fuel_cyl & -clad_cyl & -box),
+        openmc.Cell(region=+clad_cyl & -box),  # outside = void, inside box
+        openmc.Cell(region=+box),  # outside box (vacuum boundary)
+    ]
+    root = openmc.Universe(cells=cells)
+    geometry = openmc.Geometry(root)
+
+    # ----- tally: regular mesh flux -----
+    mesh = openmc.RegularMesh()
+    mesh.dimension = list(mesh_dimension)
+    mesh.lower_left = mesh_lower_left or [-pitch / 2, -pitch / 2, -1.0]
+    mesh.upper_right = mesh_upper_right or [pitch / 2, pitch / 2, 1.0]
+
+    mesh_filter = openmc.MeshFilter(mesh)
+    tally = openmc.Tally(name="flux_mesh")
+    tally.filters = [mesh_filter]
+    tally.scores = list(scores)
+    if flux_rel_err is not None:
+        trigger = openmc.Trigger("rel_err", flux_rel_err)
+        trigger.scores = ["flux"]
+        tally.triggers = [trigger]
+    tallies = openmc.Tallies([tally])
+
+    # ----- settings -----
+    settings = openmc.Settings()
+    settings.batches = batches
+    settings.inactive = INACTIVE
+    settings.particles = particles
+    if flux_rel_err is not None or keff_std is not None:
+        # OpenMC checks triggers from settings.batches on, up to the cap
+        settings.batches = min_batches or INACTIVE + 1
+        settings.trigger_active = True
+        settings.trigger_max_batches = max_batches or batches
+        settings.trigger_batch_interval = 1
+    if keff_std is not None:
+        settings.keff_trigger = {"type": "std_dev", "threshold": keff_std}
+
+    return openmc.Model(geometry, materials, settings, tallies)
+
+
+def _cross_sections():
+    config = getattr(openmc, "config", {})
+    return config.get("cross_sections") or os.environ.get("OPENMC_CROSS_SECTIONS")
+
+
+def batches_run(statepoint):
+    """Number of batches actually simulated for ``statepoint``."""
+    with openmc.StatePoint(statepoint) as state:
+        return state.current_batch
+
 
 def build_pincell(
-    fuel_r=0.4, pitch=1.3, enrich=15.0, particles=1_000, batches=20, cwd="run"
+    fuel_r=0.4,
+    pitch=1.3,
+    enrich=15.0,
+    particles=1_000,
+    batches=20,
+    cwd="run",
+    threads=1,
+    force=False,
+    cache=None,
+    flux_rel_err=None,
+    keff_std=None,
+    max_batches=None,
+    progress=None,
+    mesh_dimension=(10, 10, 1),
+    mesh_lower_left=None,
+    mesh_upper_right=None,
+    scores=("flux",),
+    catalog=None,
+    min_batches=None,
 ) -> Path:
-    Path(cwd).mkdir(exist_ok=True)
-    old_cwd = os.getcwd()
-    os.chdir(cwd)
-    try:
-        # ----- materials -----
-        fuel = openmc.Material(name="U‑Pu‑Zr fuel")
-        fuel.add_element("U", 1.0, enrichment=enrich)  # toy enrichment
-        fuel.set_density("g/cm3", 19.1)
-
-        clad = openmc.Material(name="HT9")
-        clad.add_element("Fe", 1.0)
-        clad.set_density("g/cm3", 7.8)
-
-        openmc.Materials([fuel, clad]).export_to_xml()
-
-        # ----- geometry -----
-        fuel_cyl = openmc.ZCylinder(r=fuel_r)
-        clad_cyl = openmc.ZCylinder(r=fuel_r * 1.05)
-
-        # Add a bounding box with vacuum boundary
-        box = openmc.model.RectangularParallelepiped(
-            -pitch / 2,
-            pitch / 2,
-            -pitch / 2,
-            pitch / 2,
-            -1.0,
-            1.0,
-            boundary_type="vacuum",
-        )
+    """Write the pin-cell inputs into ``cwd``, run OpenMC there, return the statepoint.
 
-        cells = [
-            openmc.Cell(fill=fuel, region=-fuel_cyl & -box),
-            openmc.Cell(fill=clad, region=+fuel_cyl & -clad_cyl & -box),
-            openmc.Cell(region=+clad_cyl & -box),  # outside = void, inside box
-            openmc.Cell(region=+box),  # outside box (vacuum boundary)
-        ]
-        root = openmc.Universe(cells=cells)
-        openmc.Geometry(root).export_to_xml()
-
-        # ----- tally: regular mesh flux -----
-        mesh = openmc.RegularMesh()
-        mesh.dimension = [10, 10, 1]
-        mesh.lower_left = [-pitch / 2, -pitch / 2, -1.0]
-        mesh.upper_right = [pitch / 2, pitch / 2, 1.0]
-
-        mesh_filter = openmc.MeshFilter(mesh)
-        tally = openmc.Tally(name="flux_mesh")
-        tally.filters = [mesh_filter]
-        tally.scores = ["flux"]
-        tallies = openmc.Tallies([tally])
-        tallies.export_to_xml()
-
-        # ----- settings -----
-        settings = openmc.Settings()
-        settings.batches = batches
-        settings.inactive = 2
-        settings.particles = particles
-        settings.export_to_xml()
-
-        # ----- run -----
-        openmc.run(cwd=".", threads=1, geometry_debug=False)
-        return Path(f"statepoint.{batches:03d}.h5")
-    finally:
-        os.chdir(old_cwd)
+    Nothing touches the process working directory, so several cases can run
+    side by side as long as each gets its own ``cwd``. Results are reused from
+    ``cache`` (default: a :class:`SimulationCache` under ``~/.cache/recore``)
+    whenever the inputs and cross sections match a previous run; pass
+    ``force=True`` to run OpenMC regardless.
+
+    With a precision target (see :func:`pincell_model`) ``batches`` is only
+    the cap and the run stops as soon as the target is met;
+    :func:`batches_run` reports the count spent.
+    ``progress`` is called with a :class:`recore.telemetry.BatchMetrics` after
+    every batch, and the same records are kept in ``cwd/metrics.jsonl``
+    (removed on a cache hit, which runs no batches).
+
+    Statepoints of earlier runs in ``cwd`` (extensions included) are removed
+    only once the new one is there, so a failed run leaves them untouched.
+    Each call, cache hits included, ends by adding the run to ``catalog``
+    (default: a :class:`recore.catalog.RunCatalog` next to the cache).
+    """
+    params = dict(
+        fuel_r=fuel_r,
+        pitch=pitch,
+        enrich=enrich,
+        particles=particles,
+        batches=batches,
+        threads=threads,
+        flux_rel_err=flux_rel_err,
+        keff_std=keff_std,
+        max_batches=max_batches,
+        min_batches=min_batches,
+        mesh_dimension=list(mesh_dimension),
+        mesh_lower_left=mesh_lower_left and list(mesh_lower_left),
+        mesh_upper_right=mesh_upper_right and list(mesh_upper_right),
+        scores=list(scores),
+    )
+    cwd = Path(cwd)
+    cwd.mkdir(parents=True, exist_ok=True)
+    model = pincell_model(
+        fuel_r,
+        pitch,
+        enrich,
+        particles,
+        batches,
+        flux_rel_err=flux_rel_err,
+        keff_std=keff_std,
+        max_batches=max_batches,
+        mesh_dimension=mesh_dimension,
+        mesh_lower_left=mesh_lower_left,
+        mesh_upper_right=mesh_upper_right,
+        scores=scores,
+        min_batches=min_batches,
+    )
+    model.export_to_xml(cwd)
+    before = _statepoints(cwd)
+
+    cache = cache or SimulationCache()
+    key = model_key(cwd, _cross_sections())
+    if catalog is None:
+        catalog = RunCatalog()
+    start = time.perf_counter()
+    hit = None if force else cache.lookup(key)
+    if hit:
+        statepoint = place(hit, cwd / hit.name)
+        _remove_stale(before, keep=statepoint)
+        # batch records of an older run must not pass for this one's progress
+        (cwd / telemetry.METRICS_FILE).unlink(missing_ok=True)
+        catalog.add(statepoint, params, key, time.perf_counter() - start, cached=True)
+        return statepoint
+
+    # ----- run -----
+    detach(cwd)  # OpenMC must not write through a link into the cache
+    records = telemetry.run(cwd, threads, callback=progress)
+    statepoint = _new_statepoint(cwd, before)
+    _remove_stale(before, keep=statepoint)
+    cache.store(key, statepoint)
+    catalog.add(
+        statepoint, params, key, time.perf_counter() - start, _rate(records, particles)
+    )
+    return statepoint
+
+
+def _statepoints(cwd):
+    return {p: p.stat().st_mtime_ns for p in Path(cwd).glob("statepoint.*.h5")}
+
+
+def _new_statepoint(cwd, before):
+    # the file this run wrote: new, or rewritten since the ``before`` snapshot
+    written = [p for p, mtime in _statepoints(cwd).items() if before.get(p) != mtime]
+    if not written:
+        raise RuntimeError(f"OpenMC finished without writing a statepoint in {cwd}")
+    return max(written, key=lambda p: int(p.name.split(".")[1]))
+
+
+def _remove_stale(before, keep):
+    # Only once the new result is in place: a failed run leaves the old
+    # statepoints alone. Every earlier run is in the cache anyway.
+    for path in before:
+        if path != keep:
+            path.unlink(missing_ok=True)
+
+
+def _rate(records, particles):
+    # particles/s over the transport phase, from the per-batch telemetry
+    if not records or records[-1].elapsed <= 0:
+        return None
+    return particles * len(records) / records[-1].elapsed
+
+
+def extend_run(
+    statepoint, extra_batches, threads=1, cache=None, progress=None, catalog=None
+) -> Path:
+    """Restart OpenMC from ``statepoint`` and simulate ``extra_batches`` more.
+
+    The run directory's settings are bumped to the new batch total (any
+    triggers are switched off so exactly ``extra_batches`` run) and OpenMC
+    resumes from the statepoint's tallies and fission source, so only the
+    increment is paid for. The new statepoint lands next to the old one,
+    where :func:`latest_statepoint` and ``analyze.py`` pick it up, and is
+    cached like a fresh run of the same length, and catalogued with the
+    parameters of the run it extends. OpenMC only restarts into a larger
+    batch total, so ``extra_batches`` must be at least 1.
+    """
+    if int(extra_batches) < 1:
+        raise ValueError("extra_batches must be a positive integer")
+    statepoint = Path(statepoint)
+    cwd = statepoint.parent
+    total = batches_run(statepoint) + int(extra_batches)
+
+    settings = openmc.Settings.from_xml(cwd / "settings.xml")
+    settings.batches = total
+    settings.trigger_active = False
+    settings.export_to_xml(cwd / "settings.xml")
+
+    start = time.perf_counter()
+    detach(cwd)
+    records = telemetry.run(cwd, threads, restart_file=statepoint, callback=progress)
+    extended = cwd / f"statepoint.{total:03d}.h5"
+    key = model_key(cwd, _cross_sections())
+    (cache or SimulationCache()).store(key, extended)
+
+    if catalog is None:
+        catalog = RunCatalog()
+    parent = catalog.latest(statepoint=statepoint)
+    params = {**(parent["params"] if parent else {}), "batches": total}
+    params.update(threads=threads, extends=str(statepoint.resolve()))
+    catalog.add(
+        extended,
+        params,
+        key,
+        time.perf_counter() - start,
+        _rate(records, settings.particles),
+    )
+    return extended
 
 
 def mesh_flux_figure():
-    parquet_file = Path("run/mesh_flux.parquet")
-    if not parquet_file.exists():
+    # Memory-mapped sidecar; None if missing or older than the latest statepoint
+    mesh = open_mesh_array("run/mesh_flux.parquet", source=latest_statepoint("run"))
+    if mesh is None:
         return go.Figure()
-    df = pd.read_parquet(parquet_file)
-    flux2d = df.values
-    # Use the same mesh extents as before
-    x = np.linspace(-0.65, 0.65, flux2d.shape[0])  # adjust as needed
-    y = np.linspace(-0.65, 0.65, flux2d.shape[1])  # adjust as needed
+    x, y = mesh.centers()
     fig = go.Figure(
         data=go.Heatmap(
-            z=flux2d.T,
+            z=mesh.mean.T,
             x=x,
             y=y,
             colorbar=dict(title="Flux"),
@@ -110,7 +329,49 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run a smoke‑test OpenMC job.")
     parser.add_argument("--particles", type=int, default=1000)
     parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--force", action="store_true", help="ignore the cache")
+    parser.add_argument("--flux-rel-err", type=float, default=None)
+    parser.add_argument("--keff-std", type=float, default=None)
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="batch cap with a precision target (default: --batches)",
+    )
+    parser.add_argument("--min-batches", type=int, default=None)
+    parser.add_argument("--mesh", type=int, nargs=3, default=[10, 10, 1])
+    parser.add_argument("--scores", nargs="+", default=["flux"])
+    parser.add_argument(
+        "--extend",
+        type=int,
+        default=None,
+        metavar="N",
+        help="add N batches to the latest statepoint in run/ instead of starting over",
+    )
     args = parser.parse_args()
 
-    sp = build_pincell(particles=args.particles, batches=args.batches)
-    print("✅  OpenMC finished.  Statepoint →", sp)
+    def show(m):
+        print(f"  batch {m.batch:4d}  k = {m.keff:.5f}  {m.rate:,.0f} particles/s")
+
+    if args.extend:
+        sp = extend_run(
+            latest_statepoint("run"), args.extend, threads=args.threads, progress=show
+        )
+        print("✅  OpenMC extended.  Statepoint →", sp, f"({batches_run(sp)} batches)")
+        raise SystemExit
+
+    sp = build_pincell(
+        particles=args.particles,
+        batches=args.batches,
+        threads=args.threads,
+        force=args.force,
+        flux_rel_err=args.flux_rel_err,
+        keff_std=args.keff_std,
+        max_batches=args.max_batches,
+        min_batches=args.min_batches,
+        progress=show,
+        mesh_dimension=args.mesh,
+        scores=args.scores,
+    )
+    print("✅  OpenMC finished.  Statepoint →", sp, f"({batches_run(sp)} batches)")
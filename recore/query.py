@@ -0,0 +1,100 @@
+"""
+Lazy queries over a partitioned tally export (see ``Dataset.to_partitioned``).
+
+Everything here starts from :func:`scan`, which only globs the files of the
+requested run/tally/score partitions and returns a ``pl.LazyFrame``; the
+helpers add filters and projections before collecting, so Polars reads
+just the needed columns and skips row groups whose statistics rule them
+out. Different tallies have different filter columns, so a scan always
+targets one tally.
+"""
+
+from pathlib import Path
+
+import polars as pl
+
+BIN_SUFFIXES = ("_x", "_y", "_z")
+
+
+def scan(root="results", tally=1, run=None, score=None) -> pl.LazyFrame:
+    """Lazy frame over one tally, optionally narrowed to a run and/or score.
+
+    The partition values become ``run``, ``tally`` and ``score`` columns.
+    """
+    pattern = (
+        Path(root) / f"run={run or '*'}" / f"tally={tally}" / f"score={score or '*'}"
+    )
+    return pl.scan_parquet(
+        str(pattern / "*.parquet"), hive_partitioning=True, try_parse_hive_dates=False
+    )
+
+
+def bin_columns(frame: pl.LazyFrame):
+    """Names of the filter-bin columns (everything but labels and results)."""
+    skip = {"run", "tally", "score", "nuclide", "mean", "std_dev"}
+    return [c for c in frame.collect_schema().names() if c not in skip]
+
+
+def _mesh_axes(frame):
+    names = frame.collect_schema().names()
+    return [
+        next(c for c in names if c.startswith("mesh_") and c.endswith(s))
+        for s in BIN_SUFFIXES
+    ]
+
+
+def mesh_slice(root="results", z=0, tally=1, run=None, score="flux") -> pl.DataFrame:
+    """Mean and std. dev. on the z-plane ``z`` of a mesh tally, as x/y/mean/std_dev rows."""
+    frame = scan(root, tally, run, score)
+    x, y, zc = _mesh_axes(frame)
+    return (
+        frame.filter(pl.col(zc) == z)
+        .select("run", pl.col(x).alias("x"), pl.col(y).alias("y"), "mean", "std_dev")
+        .sort("run", "y", "x")
+        .collect()
+    )
+
+
+def sum_over_energy(root="results", tally=1, run=None, score="flux") -> pl.DataFrame:
+    """Collapse the energy filter: means add, standard deviations add in quadrature."""
+    frame = scan(root, tally, run, score)
+    keys = [c for c in bin_columns(frame) if not c.startswith("energy_")]
+    return (
+        frame.group_by("run", "score", "nuclide", *keys)
+        .agg(pl.col("mean").sum(), (pl.col("std_dev") ** 2).sum().sqrt())
+        .sort("run", *keys)
+        .collect()
+    )
+
+
+def compare_runs(run_a, run_b, root="results", tally=1, score="flux") -> pl.DataFrame:
+    """Bin-by-bin difference of ``run_b`` minus ``run_a`` with its z-score."""
+    frames = [scan(root, tally, run, score) for run in (run_a, run_b)]
+    keys = ["score", "nuclide", *bin_columns(frames[0])]
+    a, b = [f.select(*keys, "mean", "std_dev") for f in frames]
+    return (
+        a.join(b, on=keys, suffix="_b")
+        .with_columns(
+            diff=pl.col("mean_b") - pl.col("mean"),
+            ratio=pl.col("mean_b") / pl.col("mean"),
+        )
+        .with_columns(
+            z_score=pl.col("diff")
+            / (pl.col("std_dev") ** 2 + pl.col("std_dev_b") ** 2).sqrt()
+        )
+        .rename({"mean": "mean_a", "std_dev": "std_dev_a"})
+        .collect()
+    )
+
+
+def top_relative_error(
+    root="results", n=10, tally=1, run=None, score="flux"
+) -> pl.DataFrame:
+    """The ``n`` bins with the largest relative error ``std_dev / mean``."""
+    frame = scan(root, tally, run, score)
+    return (
+        frame.filter(pl.col("mean") > 0)
+        .with_columns(rel_err=pl.col("std_dev") / pl.col("mean"))
+        .top_k(n, by="rel_err")
+        .collect()
+    )
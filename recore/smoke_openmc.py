@@ -1,11 +1,17 @@
-from recore.openmc_run import build_pincell
+import sys
 
+from recore.openmc_run import batches_run, build_pincell
 
-def main():
-    """Run the smoke test and return True if successful."""
+
+def main(force=False):
+    """Run the smoke test and return True if successful.
+
+    An identical earlier run is served from the simulation cache unless
+    ``force`` is set.
+    """
     try:
-        sp = build_pincell(particles=1000, batches=20)
-        print(f"Smoke test complete. Statepoint: {sp}")
+        sp = build_pincell(particles=1000, batches=20, force=force)
+        print(f"Smoke test complete. Statepoint: {sp} ({batches_run(sp)} batches)")
         return True
     except Exception as e:
         print(f"Smoke test failed: {e}")
@@ -13,4 +19,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(force="--force" in sys.argv[1:])
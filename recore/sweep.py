@@ -0,0 +1,111 @@
+"""
+Run a grid of pin-cell cases in parallel and collect k-eff for each.
+
+Every case gets its own run directory under ``root`` and its own OpenMC
+process, so cases never share inputs, statepoints or a working directory.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from pathlib import Path
+import argparse
+import os
+
+import pandas as pd
+
+from recore.catalog import RunCatalog
+from recore.openmc_run import build_pincell
+
+
+def expand_grid(**axes):
+    """Cartesian product of keyword axes, e.g. ``expand_grid(pitch=[1.2, 1.3])``."""
+    names = list(axes)
+    return [dict(zip(names, values)) for values in product(*axes.values())]
+
+
+def plan_workers(n_cases, threads_per_case=1, cores=None):
+    """Number of concurrent cases that fills ``cores`` at ``threads_per_case`` each."""
+    cores = cores or os.cpu_count() or 1
+    return max(1, min(n_cases, cores // max(1, threads_per_case)))
+
+
+def _run_case(index, case, root, threads, particles, batches, force):
+    run_dir = Path(root) / f"case_{index:04d}"
+    sp = build_pincell(
+        **case,
+        particles=particles,
+        batches=batches,
+        cwd=run_dir,
+        threads=threads,
+        force=force,
+    )
+    run = RunCatalog().latest(statepoint=sp)  # written by build_pincell
+    return {
+        "case": index,
+        **case,
+        "statepoint": str(sp),
+        "keff": run["keff"],
+        "keff_std": run["keff_std"],
+        "leakage": run["leakage"],
+        "batches": run["batches_run"],
+        "wall_time": run["wall_time"],
+    }
+
+
+def sweep(
+    cases,
+    root="sweep",
+    threads_per_case=1,
+    workers=None,
+    particles=1_000,
+    batches=20,
+    force=False,
+):
+    """Run every case in ``cases`` (dicts of ``build_pincell`` keywords).
+
+    Cases run on a process pool of ``workers`` processes (default: enough to
+    use every core at ``threads_per_case`` OpenMC threads each). Returns one
+    row per case, in case order, with the statepoint path, k-eff ± 1σ,
+    leakage and wall time, as recorded in the run catalog.
+    Cases already in the simulation cache are not re-run unless ``force``.
+    """
+    cases = list(cases)
+    workers = workers or plan_workers(len(cases), threads_per_case)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _run_case, i, case, root, threads_per_case, particles, batches, force
+            )
+            for i, case in enumerate(cases)
+        ]
+        rows = [f.result() for f in as_completed(futures)]
+    return pd.DataFrame(rows).sort_values("case", ignore_index=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep the OpenMC pin cell.")
+    parser.add_argument("--fuel-r", type=float, nargs="+", default=[0.4])
+    parser.add_argument("--pitch", type=float, nargs="+", default=[1.3])
+    parser.add_argument("--enrich", type=float, nargs="+", default=[15.0])
+    parser.add_argument("--particles", type=int, default=1000)
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--threads-per-case", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--root", default="sweep")
+    parser.add_argument("--out", default="sweep/results.csv")
+    parser.add_argument("--force", action="store_true", help="ignore the cache")
+    args = parser.parse_args()
+
+    grid = expand_grid(fuel_r=args.fuel_r, pitch=args.pitch, enrich=args.enrich)
+    table = sweep(
+        grid,
+        root=args.root,
+        threads_per_case=args.threads_per_case,
+        workers=args.workers,
+        particles=args.particles,
+        batches=args.batches,
+        force=args.force,
+    )
+    Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+    table.to_csv(args.out, index=False)
+    print(table.to_string(index=False))
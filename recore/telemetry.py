@@ -0,0 +1,113 @@
+"""
+Run OpenMC as a subprocess and report each batch as it finishes.
+
+OpenMC prints one line per eigenvalue batch (``  7/1    1.02345    1.01987
++/- 0.00321``). :func:`stream` parses those lines while the run is going,
+timestamps them and yields :class:`BatchMetrics`; :func:`run` drives a
+callback with them. Every run also leaves a ``metrics.jsonl`` file in its
+directory, one JSON record per batch, for throughput comparisons later.
+"""
+
+from pathlib import Path
+from typing import NamedTuple, Optional
+import json
+import re
+import subprocess
+import time
+
+import openmc
+
+METRICS_FILE = "metrics.jsonl"
+
+# "batch/gen  k  [entropy]  [average k +/- std]"; entropy only when it is on
+_NUMBER = r"[-+.\deE]+"
+_BATCH_LINE = re.compile(
+    rf"^\s*(\d+)/\d+\s+({_NUMBER})(?:\s+{_NUMBER})?"
+    rf"(?:\s+({_NUMBER})\s+\+/-\s+({_NUMBER}))?\s*$"
+)
+
+
+class BatchMetrics(NamedTuple):
+    batch: int
+    keff: float  # this batch's estimate
+    keff_mean: Optional[float]  # running active-batch mean (None while inactive)
+    keff_std: Optional[float]
+    elapsed: float  # s since the first batch started
+    rate: float  # particles/s over this batch
+
+
+def parse_batch_line(line):
+    """``(batch, keff, mean, std)`` for an OpenMC batch line, else None."""
+    match = _BATCH_LINE.match(line)
+    if not match:
+        return None
+    batch, keff, mean, std = match.groups()
+    return (
+        int(batch),
+        float(keff),
+        None if mean is None else float(mean),
+        None if std is None else float(std),
+    )
+
+
+def stream(cwd="run", threads=1, restart_file=None, executable="openmc"):
+    """Run OpenMC in ``cwd`` and yield a :class:`BatchMetrics` per batch.
+
+    Raises ``subprocess.CalledProcessError`` (with the full output) if
+    OpenMC exits with an error.
+    """
+    cwd = Path(cwd)
+    particles = openmc.Settings.from_xml(cwd / "settings.xml").particles
+    args = [executable, "-s", str(threads)]
+    if restart_file is not None:
+        args += ["-r", str(Path(restart_file).resolve())]
+
+    output = []
+    with open(cwd / METRICS_FILE, "w") as metrics, subprocess.Popen(
+        args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        start = last = None
+        for line in proc.stdout:
+            output.append(line)
+            if "SIMULATION" in line:  # transport starts after the banner
+                start = last = time.perf_counter()
+            parsed = parse_batch_line(line) if start is not None else None
+            if parsed is None:
+                continue
+            now = time.perf_counter()
+            record = BatchMetrics(
+                *parsed, now - start, particles / max(now - last, 1e-9)
+            )
+            last = now
+            metrics.write(json.dumps(record._asdict()) + "\n")
+            metrics.flush()
+            yield record
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, args, "".join(output))
+
+
+def run(cwd="run", threads=1, restart_file=None, callback=None):
+    """Run OpenMC to completion, calling ``callback(metrics)`` after each batch.
+
+    Returns the list of :class:`BatchMetrics`.
+    """
+    records = []
+    for record in stream(cwd, threads, restart_file):
+        if callback is not None:
+            callback(record)
+        records.append(record)
+    return records
+
+
+def read_metrics(cwd="run"):
+    """Batch records persisted by the last run in ``cwd`` (empty if none)."""
+    path = Path(cwd) / METRICS_FILE
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return [BatchMetrics(**json.loads(line)) for line in f]
@@ -0,0 +1,65 @@
+import os
+
+from recore.cache import SimulationCache, detach, model_key, place
+
+
+def _inputs(directory, particles):
+    directory.mkdir(exist_ok=True)
+    (directory / "settings.xml").write_text(f"<particles>{particles}</particles>")
+    (directory / "geometry.xml").write_text("<geometry/>")
+    return directory
+
+
+def test_key_depends_on_inputs_and_cross_sections(tmp_path):
+    xs = tmp_path / "cross_sections.xml"
+    xs.write_text("<library/>")
+    a = model_key(_inputs(tmp_path / "a", 1000), xs)
+    assert a == model_key(_inputs(tmp_path / "b", 1000), xs)
+    assert a != model_key(_inputs(tmp_path / "c", 2000), xs)
+    assert a != model_key(tmp_path / "a", None)
+
+
+def test_hit_returns_stored_statepoint(tmp_path):
+    cache = SimulationCache(tmp_path / "cache")
+    sp = tmp_path / "statepoint.020.h5"
+    sp.write_bytes(b"data")
+    assert cache.lookup("k") is None
+    cache.store("k", sp)
+    hit = cache.lookup("k")
+    assert hit.read_bytes() == b"data"
+    (tmp_path / "run").mkdir()
+    assert place(hit, tmp_path / "run" / sp.name).read_bytes() == b"data"
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = SimulationCache(tmp_path / "cache", max_bytes=350)
+    sp = tmp_path / "statepoint.020.h5"
+    sp.write_bytes(b"x" * 100)
+    for i, key in enumerate("abc"):
+        cache.store(key, sp)
+        os.utime(cache.root / key, (i, i))
+    cache.lookup("a")  # touch "a" so "b" is now the oldest
+    cache.store("d", sp)
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") is not None
+    assert cache.size() <= 350
+
+
+def test_writing_after_detach_leaves_the_cache_entry_alone(tmp_path):
+    import h5py
+
+    cache = SimulationCache(tmp_path / "cache")
+    sp = tmp_path / "statepoint.020.h5"
+    with h5py.File(sp, "w") as f:
+        f["k"] = 1.0
+    cache.store("a", sp)
+    run = tmp_path / "run"
+    run.mkdir()
+    placed = place(cache.lookup("a"), run / sp.name)
+
+    detach(run)
+    assert placed.stat().st_nlink == 1
+    with h5py.File(placed, "w") as f:  # what OpenMC does with H5F_ACC_TRUNC
+        f["k"] = 2.0
+    with h5py.File(cache.lookup("a"), "r") as f:
+        assert f["k"][()] == 1.0
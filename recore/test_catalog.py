@@ -0,0 +1,78 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from recore.catalog import RunCatalog
+from recore.conftest import history_statepoint
+
+
+def _add(catalog, path, pitch, **kwargs):
+    path.parent.mkdir(exist_ok=True)
+    history_statepoint(path, np.ones(10))
+    params = {"fuel_r": 0.4, "pitch": pitch, "enrich": 15.0, "scores": ["flux"]}
+    return catalog.add(path, params, f"hash-{pitch}", **kwargs)
+
+
+def test_add_records_parameters_and_statepoint_results(tmp_path):
+    catalog = RunCatalog(tmp_path / "catalog.sqlite")
+    sp = tmp_path / "a" / "statepoint.10.h5"
+    _add(catalog, sp, 1.3, wall_time=2.5, particle_rate=1e4)
+
+    run = catalog.latest(statepoint=sp)
+    assert run["pitch"] == 1.3 and run["params"]["scores"] == ["flux"]
+    assert run["input_hash"] == "hash-1.3"
+    assert (run["keff"], run["keff_std"]) == (1.1, 0.01)
+    assert run["leakage"] == pytest.approx(0.2)
+    assert (run["wall_time"], run["particle_rate"], run["cached"]) == (2.5, 1e4, False)
+
+
+def test_find_filters_on_indexed_columns(tmp_path):
+    catalog = RunCatalog(tmp_path / "catalog.sqlite")
+    for i, pitch in enumerate((1.2, 1.3, 1.4)):
+        _add(catalog, tmp_path / f"case_{i}" / "statepoint.10.h5", pitch)
+    _add(catalog, tmp_path / "case_1" / "statepoint.10.h5", 1.3, cached=True)
+
+    assert len(catalog) == 4
+    assert len(catalog.find(pitch=1.3)) == 2
+    assert catalog.latest(run_dir=tmp_path / "case_1")["cached"]
+    assert catalog.find(keff_min=1.0, keff_max=1.2, limit=3)[0]["pitch"] == 1.3
+    assert catalog.find(input_hash="hash-1.4")[0]["run_dir"].endswith("case_2")
+    with pytest.raises(ValueError):
+        catalog.find(colour="red")
+
+    with sqlite3.connect(catalog.path) as con:
+        plan = con.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM runs WHERE input_hash = ?", ("x",)
+        ).fetchall()
+    assert "runs_input_hash" in str(plan)
+
+
+def test_order_by_accepts_only_a_column_and_direction(tmp_path):
+    catalog = RunCatalog(tmp_path / "catalog.sqlite")
+    for i, pitch in enumerate((1.3, 1.2, 1.4)):
+        _add(catalog, tmp_path / f"case_{i}" / "statepoint.10.h5", pitch)
+
+    assert [r["pitch"] for r in catalog.find(order_by="pitch")] == [1.2, 1.3, 1.4]
+    assert catalog.find(order_by="pitch desc")[0]["pitch"] == 1.4
+    for bad in ("keff, (SELECT 1)", "pitch; DROP TABLE runs", "pitch sideways", ""):
+        with pytest.raises(ValueError):
+            catalog.find(order_by=bad)
+    assert len(catalog) == 3
+
+
+def test_run_analysis_uses_the_catalog_it_is_given_even_when_empty(
+    tmp_path, monkeypatch
+):
+    pytest.importorskip("openmc")
+    from recore import gui
+
+    def no_default_catalog():
+        raise AssertionError("fell back to the default catalog")
+
+    monkeypatch.setattr(gui, "RunCatalog", no_default_catalog)
+    catalog = RunCatalog(tmp_path / "catalog.sqlite")
+    sp = tmp_path / "run" / "statepoint.10.h5"
+    sp.parent.mkdir()
+    history_statepoint(sp, np.ones(10))
+    assert gui.run_analysis(sp, catalog=catalog)["k_effective"] == 1.1
@@ -0,0 +1,21 @@
+import json
+
+from recore import codec_bench
+
+
+def test_suite_writes_one_record_per_table_and_config(tmp_path):
+    tables = {"tiny": codec_bench.synthetic_tally(4, 4, 2)}
+    out = tmp_path / "bench.json"
+    records = codec_bench.run_suite(
+        tables, configs=("snappy", "zstd-3-bss"), repeat=1, out=out
+    )
+    assert [r["config"] for r in records] == ["snappy", "zstd-3-bss"]
+    assert json.loads(out.read_text()) == records
+    assert all(r["rows"] == 64 and r["file_bytes"] > 0 for r in records)
+    # the read-back table alone is a fresh allocation of the raw bytes
+    assert all(r["peak_bytes"] >= r["raw_bytes"] for r in records)
+
+    header, *rows = codec_bench.format_records(
+        [{**records[0], "config": "zstd-3-labeldict"}, records[1]]
+    ).splitlines()
+    assert len({len(line) for line in (header, *rows)}) == 1
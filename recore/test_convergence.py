@@ -0,0 +1,45 @@
+import numpy as np
+
+from recore.conftest import history_statepoint
+from recore.convergence import history_table, read_history, sweep_history
+
+
+def test_running_mean_covers_active_batches_only(tmp_path):
+    k = np.array([0.5, 0.8, 1.0, 1.2, 1.1, 1.3])
+    history_statepoint(tmp_path / "statepoint.6.h5", k)
+    h = read_history(tmp_path / "statepoint.6.h5")
+
+    assert np.isnan(h["k_mean"][:2]).all()
+    assert np.allclose(h["k_mean"][2:], np.cumsum(k[2:]) / np.arange(1, 5))
+    assert np.isnan(h["k_std"][2])
+    assert np.isclose(h["k_std"][-1], k[2:].std(ddof=1) / 2)
+    assert np.allclose(h["leakage"], 0.2) and np.allclose(h["leakage_std"], 0.0)
+
+
+def test_generations_per_batch_are_averaged_per_batch(tmp_path):
+    k = np.array([1.0, 2.0, 1.0, 1.0, 2.0, 2.0])
+    history_statepoint(tmp_path / "sp.h5", k, n_inactive=1, per_batch=2, entropy=False)
+    h = read_history(tmp_path / "sp.h5")
+
+    assert h["batch"].tolist() == [1, 1, 2, 2, 3, 3]
+    assert np.allclose(h["k_mean"][2:], [1.0, 1.0, 1.5, 1.5])
+    assert np.isnan(h["entropy"]).all()
+
+
+def test_sweep_history_is_one_table_with_latest_statepoint_per_run(tmp_path):
+    for case, batches in (("case_0000", 10), ("case_0001", 15)):
+        (tmp_path / case).mkdir()
+        history_statepoint(tmp_path / case / "statepoint.5.h5", np.ones(5))
+        history_statepoint(
+            tmp_path / case / f"statepoint.{batches}.h5", np.ones(batches)
+        )
+
+    table = sweep_history(tmp_path, workers=2)
+    assert table.num_rows == 25
+    runs = table["run"].to_pylist()
+    assert runs.count("case_0000") == 10 and runs.count("case_0001") == 15
+
+    serial = history_table(
+        [tmp_path / "case_0000" / "statepoint.10.h5"], ["case_0000"], workers=1
+    )
+    assert serial.column_names == table.column_names
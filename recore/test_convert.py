@@ -0,0 +1,50 @@
+import os
+
+from recore.conftest import mesh_tally_statepoint
+from recore.convert import convert_tree
+
+
+def test_unchanged_statepoints_are_skipped(tmp_path):
+    src = tmp_path / "sweep"
+    for case in ("case_0000", "case_0001"):
+        (src / case).mkdir(parents=True)
+        mesh_tally_statepoint(src / case / "statepoint.020.h5", (3, 3, 1), ["flux"])
+    out = tmp_path / "results"
+
+    first = convert_tree(src, out, workers=2)
+    assert (first["converted"], first["skipped"]) == (2, 0)
+    assert (out / "run=case_0001__statepoint.020" / "tally=1" / "score=flux").is_dir()
+
+    # touching a file without changing it is caught by the hash
+    os.utime(src / "case_0000" / "statepoint.020.h5", ns=(0, 0))
+    assert convert_tree(src, out)["converted"] == 0
+
+    mesh_tally_statepoint(
+        src / "case_0001" / "statepoint.020.h5", (3, 3, 1), ["flux"], n=20
+    )
+    again = convert_tree(src, out)
+    assert (again["converted"], again["skipped"]) == (1, 1)
+
+
+def test_failures_are_reported_and_deleted_sources_pruned(tmp_path):
+    import json
+
+    src = tmp_path / "sweep"
+    for case in ("case_0000", "case_0001", "case_0002"):
+        (src / case).mkdir(parents=True)
+        mesh_tally_statepoint(src / case / "statepoint.020.h5", (3, 3, 1), ["flux"])
+    (src / "case_0002" / "statepoint.020.h5").write_bytes(b"not hdf5")
+    out = tmp_path / "results"
+
+    first = convert_tree(src, out, workers=2)
+    assert first["converted"] == 2
+    assert list(first["failed"]) == [os.path.join("case_0002", "statepoint.020.h5")]
+    assert len(json.loads((out / "manifest.json").read_text())) == 2
+
+    (src / "case_0000" / "statepoint.020.h5").unlink()
+    again = convert_tree(src, out)
+    assert (again["removed"], again["skipped"]) == (1, 1)
+    assert not (out / "run=case_0000__statepoint.020").exists()
+    assert list(json.loads((out / "manifest.json").read_text())) == [
+        os.path.join("case_0001", "statepoint.020.h5")
+    ]
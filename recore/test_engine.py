@@ -0,0 +1,44 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("openmc.lib")
+if not os.environ.get("OPENMC_CROSS_SECTIONS"):
+    pytest.skip("needs OpenMC cross sections", allow_module_level=True)
+
+from recore.engine import get_engine
+
+
+def test_engine_reruns_are_reproducible(tmp_path):
+    engine = get_engine(workdir=tmp_path)
+    first = engine.run(particles=200, batches=5, inactive=2)
+    engine.set_enrichment(10.0)
+    lower = engine.run()
+    engine.set_enrichment(15.0)
+    again = engine.run()
+    assert again["keff"] == first["keff"]
+    assert np.array_equal(again["mean"], first["mean"])
+    assert lower["keff"] < first["keff"]
+
+
+def test_closed_engine_is_not_reused_and_statepoint_is_numbered(tmp_path):
+    from recore.tally_io import latest_statepoint
+
+    engine = get_engine(workdir=tmp_path)  # may be the engine of an earlier test
+    engine.run(particles=200, batches=5, inactive=2)
+    sp = engine.write_statepoint()
+    assert sp.name == "statepoint.005.h5"
+    assert latest_statepoint(engine.workdir) == sp
+    engine.close()
+    engine.close()  # closing twice does not finalize the next session
+    assert get_engine(workdir=tmp_path) is not engine
+
+
+def test_second_engine_does_not_reinitialize_openmc(tmp_path):
+    from recore.engine import Engine
+
+    engine = get_engine(workdir=tmp_path)
+    with pytest.raises(RuntimeError, match="get_engine"):
+        Engine(workdir=tmp_path / "other")
+    assert get_engine() is engine
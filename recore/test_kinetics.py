@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import numpy as np
 import pytest
 from recore import kinetics
@@ -32,3 +36,204 @@ def test_solve_conserves_power_at_zero_rho():
     ts, ps = kinetics.solve(rho_step=0.0, t_end=5.0, dt=1e-3)
     # Power should remain close to 1.0 for all times
     assert np.allclose(ps, 1.0, atol=1e-2)
+
+
+def test_solve_matches_reference_loop():
+    ts, ps = kinetics.solve(rho_step=0.003, t_end=5.0, dt=1e-3)
+    ts_ref, ps_ref = kinetics._solve_reference(rho_step=0.003, t_end=5.0, dt=1e-3)
+    assert ts.shape == ts_ref.shape
+    assert np.allclose(ts, ts_ref)
+    assert np.allclose(ps, ps_ref, rtol=1e-12)
+
+
+def test_compiled_solve_is_at_least_50x_faster():
+    assert kinetics.benchmark(repeat=3) >= 50
+
+
+def test_solve_many_matches_solve():
+    rhos = np.array([0.0, 0.001, 0.002, 0.005])
+    ts, ps = kinetics.solve_many(rhos, t_end=1.0)
+    assert ps.shape == (rhos.size, ts.size)
+    for rho, row in zip(rhos, ps):
+        ts_one, ps_one = kinetics.solve(rho_step=rho, t_end=1.0)
+        assert np.allclose(ts, ts_one)
+        assert np.allclose(row, ps_one, rtol=1e-12)
+
+
+@pytest.mark.parametrize("rho_step", [-0.005, 0.001])
+def test_stiff_methods_match_rk4_on_long_transient(rho_step):
+    ts, ps = kinetics.solve(rho_step=rho_step, t_end=600.0)
+    ta, pa = kinetics.solve(rho_step=rho_step, t_end=600.0, method="adaptive")
+    assert np.isclose(ta[-1], 600.0)
+    assert ta.size < 1000  # vs. 600k RK4 steps
+    assert np.isclose(pa[-1], ps[-1], rtol=1e-3)
+    ti, pi = kinetics.solve(rho_step=rho_step, t_end=600.0, dt=0.5, method="implicit")
+    assert ti.size == 1201
+    assert np.isclose(pi[-1], ps[-1], rtol=1e-3)
+
+
+def test_solve_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        kinetics.solve(method="euler")
+
+
+@pytest.mark.parametrize("rho_step", [-0.005, 0.0, 0.002])
+def test_solve_exact_matches_fine_rk4(rho_step):
+    ts, ps = kinetics.solve(rho_step=rho_step, t_end=5.0, dt=1e-4)
+    ts_exact, ps_exact, _ = kinetics.solve_exact(rho_step, ts)
+    assert np.array_equal(ts_exact, ts)
+    assert np.allclose(ps_exact, ps, rtol=1e-6)
+
+
+def test_solve_exact_stable_period():
+    _, ps, period = kinetics.solve_exact(0.001, [1000.0, 1001.0])
+    assert np.isclose(np.log(ps[1] / ps[0]), 1.0 / period, rtol=1e-6)
+    assert np.isclose(period, 1.0 / kinetics.inhour_roots(0.001)[-1])
+    assert kinetics.solve_exact(0.0, [1.0])[2] == np.inf
+
+
+def test_delayed_step_schedule_matches_shifted_exact_solution():
+    ts, ps = kinetics.solve(schedule=kinetics.step(0.002, t0=1.0), t_end=3.0)
+    assert np.allclose(ps[ts < 1.0], 1.0)
+    late = ts >= 1.1  # let the prompt jump settle after the discontinuity
+    _, ps_exact, _ = kinetics.solve_exact(0.002, ts[late] - 1.0)
+    assert np.allclose(ps[late], ps_exact, rtol=1e-3)
+
+
+def test_ramp_and_table_schedules_agree():
+    ramp = kinetics.ramp(0.001, t_start=0.5, t_stop=2.5)
+    tab = kinetics.table([0.5, 2.5], [0.0, 0.002])
+    _, ps_ramp = kinetics.solve(schedule=ramp, t_end=4.0)
+    _, ps_table = kinetics.solve(schedule=tab, t_end=4.0)
+    assert np.allclose(ps_ramp, ps_table, rtol=1e-12)
+    assert ps_ramp[-1] > 1.0
+
+
+def test_zero_amplitude_sine_stays_critical():
+    _, ps = kinetics.solve(schedule=kinetics.sine(0.0, period=1.0), t_end=2.0)
+    assert np.allclose(ps, 1.0, atol=1e-9)
+
+
+@pytest.mark.parametrize("method", ["implicit", "adaptive"])
+def test_schedule_and_feedback_methods_agree_with_rk4(method):
+    feedback = kinetics.Feedback(alpha_fuel=-2e-5, fuel_heatup=50.0, tau_fuel=2.0)
+    schedule = kinetics.ramp(0.002, t_stop=1.0)
+    ts, ps = kinetics.solve(schedule=schedule, feedback=feedback, t_end=20.0)
+    _, ps_free = kinetics.solve(schedule=schedule, t_end=20.0)
+    assert ps[-1] < ps_free[-1]  # negative Doppler feedback limits the excursion
+    dt = 0.01 if method == "implicit" else 1e-3
+    t_m, ps_m = kinetics.solve(
+        schedule=schedule, feedback=feedback, t_end=20.0, dt=dt, method=method
+    )
+    assert np.allclose(ps_m, np.interp(t_m, ts, ps), rtol=1e-2)
+    assert np.isclose(ps_m[-1], ps[-1], rtol=1e-3)
+
+
+def test_table_schedule_validation():
+    with pytest.raises(ValueError):
+        kinetics.table([1.0, 0.0], [0.0, 0.001])
+    with pytest.raises(ValueError):
+        kinetics.table([0.0, 1.0], [0.0])
+
+
+def test_every_keeps_every_kth_step_and_the_last():
+    ts, ps = kinetics.solve(t_end=1.0)
+    ts_k, ps_k = kinetics.solve(t_end=1.0, every=300)
+    assert np.allclose(ts_k, [0.0, 0.3, 0.6, 0.9, 1.0])
+    assert np.allclose(ps_k, ps[[0, 300, 600, 900, 1000]], rtol=1e-12)
+    ts_m, ps_m = kinetics.solve_many([0.002], t_end=1.0, every=300)
+    assert np.allclose(ts_m, ts_k)
+    assert np.allclose(ps_m[0], ps_k, rtol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["rk4", "implicit", "adaptive"])
+def test_sample_times_land_exactly(method):
+    samples = np.array([0.0, 0.0137, 0.5, 2.25, 3.0])
+    dt = 1e-2 if method == "adaptive" else 1e-3
+    ts, ps = kinetics.solve(method=method, dt=dt, sample_times=samples)
+    assert np.array_equal(ts, samples)
+    _, ps_exact, _ = kinetics.solve_exact(0.002, samples)
+    assert np.allclose(ps, ps_exact, rtol=1e-3)
+
+
+def test_precursors_are_returned_with_power():
+    ts, ps, cs = kinetics.solve(rho_step=0.0, t_end=1.0, precursors=True)
+    assert cs.shape == (ts.size, 6)
+    assert np.allclose(cs, kinetics._B / (kinetics.GEN_TIME * kinetics._L))
+    assert np.allclose(ps, kinetics.solve(rho_step=0.0, t_end=1.0)[1])
+
+
+@pytest.mark.parametrize("method", ["rk4", "adaptive"])
+def test_chunks_reassemble_to_solve(method):
+    ts, ps, cs = kinetics.solve(t_end=2.0, method=method, precursors=True)
+    blocks = list(kinetics.solve_chunks(t_end=2.0, method=method, chunk_size=64))
+    assert len(blocks) > 1
+    assert all(len(b[0]) <= 64 for b in blocks)
+    assert np.array_equal(np.concatenate([b[0] for b in blocks]), ts)
+    assert np.allclose(np.concatenate([b[1] for b in blocks]), ps, rtol=1e-12)
+    assert np.allclose(np.concatenate([b[2] for b in blocks]), cs, rtol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["rk4", "adaptive"])
+def test_empty_sample_times_give_empty_arrays(method):
+    ts, ps, cs = kinetics.solve(method=method, sample_times=[], precursors=True)
+    assert (ts.shape, ps.shape, cs.shape) == ((0,), (0,), (0, 6))
+    assert kinetics.solve(sample_times=[])[1].shape == (0,)
+
+
+def test_chunk_size_must_be_positive():
+    with pytest.raises(ValueError, match="chunk_size"):
+        next(kinetics.solve_chunks(chunk_size=0))
+    with pytest.raises(ValueError, match="chunk_size"):
+        next(kinetics.ensemble_chunks(n_samples=2, chunk_size=0))
+
+
+def test_parameters_round_trip_and_change_result():
+    v = kinetics.DEFAULT_PARAMETERS.vector()
+    assert np.array_equal(kinetics.Parameters.from_vector(v).vector(), v)
+    slow = kinetics.Parameters.from_vector(np.r_[v[:6], 2 * v[6:12], v[12]])
+    _, ps = kinetics.solve(0.002, t_end=1.0)
+    _, ps_slow = kinetics.solve(0.002, t_end=1.0, params=slow)
+    assert ps_slow[-1] < ps[-1]
+
+
+def test_ensemble_without_spread_matches_solve():
+    ts, bands = kinetics.solve_ensemble(0.002, n_samples=4, t_end=1.0, chunk_size=100)
+    _, ps = kinetics.solve(0.002, t_end=1.0)
+    assert bands.shape == (3, ts.size)
+    assert np.allclose(bands, ps, rtol=1e-12)
+
+
+def test_ensemble_bands_are_ordered():
+    cov = (0.05 * kinetics.DEFAULT_PARAMETERS.vector()) ** 2
+    ts, bands = kinetics.solve_ensemble(
+        0.002, cov, n_samples=200, t_end=2.0, every=10, seed=1
+    )
+    assert np.all(np.diff(bands, axis=0) >= 0)
+    assert bands[2, -1] - bands[0, -1] > 0.01 * bands[1, -1]
+
+
+FIRST_CALL_BUDGET = 1.0  # s, for a fresh process once kernels are cached
+
+
+def _run_python(code):
+    repo = Path(__file__).resolve().parent.parent
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_first_call_latency_after_warmup():
+    _run_python("from recore import kinetics; kinetics.warmup()")
+    out = _run_python(
+        "import time\n"
+        "from recore import kinetics\n"
+        "start = time.perf_counter()\n"
+        "kinetics.solve()\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    assert float(out.stdout) < FIRST_CALL_BUDGET
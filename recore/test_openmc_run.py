@@ -0,0 +1,169 @@
+import pytest
+
+pytest.importorskip("openmc")
+
+from recore.openmc_run import latest_statepoint
+
+
+def test_latest_statepoint_sorts_batches_numerically(tmp_path):
+    for batch in (20, 100, 99):
+        (tmp_path / f"statepoint.{batch:03d}.h5").touch()
+    (tmp_path / "statepoint.1000.h5").touch()
+    assert latest_statepoint(tmp_path).name == "statepoint.1000.h5"
+    assert latest_statepoint(tmp_path / "missing") is None
+
+
+def test_precision_target_turns_batches_into_the_cap():
+    from recore.openmc_run import INACTIVE, pincell_model
+
+    settings = pincell_model(batches=20).settings
+    assert settings.batches == 20 and not settings.trigger_active
+
+    model = pincell_model(batches=200, flux_rel_err=0.01, keff_std=1e-3)
+    settings = model.settings
+    assert settings.batches == INACTIVE + 1
+    assert settings.trigger_active and settings.trigger_max_batches == 200
+    assert settings.keff_trigger == {"type": "std_dev", "threshold": 1e-3}
+    (trigger,) = model.tallies[0].triggers
+    assert (trigger.trigger_type, trigger.threshold) == ("rel_err", 0.01)
+    assert list(trigger.scores) == ["flux"]
+
+    settings = pincell_model(keff_std=1e-3, min_batches=10, max_batches=50).settings
+    assert (settings.batches, settings.trigger_max_batches) == (10, 50)
+    assert len(pincell_model().tallies[0].triggers) == 0
+
+
+def test_old_statepoints_survive_a_failed_run(tmp_path, monkeypatch):
+    import numpy as np
+
+    from recore import openmc_run
+    from recore.cache import SimulationCache
+    from recore.catalog import RunCatalog
+    from recore.conftest import history_statepoint
+
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    extended = run_dir / "statepoint.050.h5"
+    history_statepoint(extended, np.ones(50))
+
+    def failed_run(cwd, threads, callback=None):
+        raise RuntimeError("openmc failed")
+
+    def good_run(cwd, threads, callback=None):
+        history_statepoint(cwd / "statepoint.020.h5", np.ones(20))
+        return []
+
+    kwargs = dict(
+        cwd=run_dir,
+        cache=SimulationCache(tmp_path / "cache"),
+        catalog=RunCatalog(tmp_path / "catalog.sqlite"),
+        force=True,
+    )
+    monkeypatch.setattr(openmc_run.telemetry, "run", failed_run)
+    with pytest.raises(RuntimeError):
+        openmc_run.build_pincell(**kwargs)
+    assert extended.exists()
+
+    monkeypatch.setattr(openmc_run.telemetry, "run", good_run)
+    sp = openmc_run.build_pincell(**kwargs)
+    assert sp.name == "statepoint.020.h5"
+    assert [p.name for p in run_dir.glob("statepoint.*.h5")] == [sp.name]
+
+
+def test_extend_run_bumps_batch_total_and_disables_triggers(tmp_path, monkeypatch):
+    import numpy as np
+    import openmc
+
+    from recore import openmc_run
+    from recore.cache import SimulationCache
+    from recore.catalog import RunCatalog
+    from recore.conftest import history_statepoint
+
+    run_dir = tmp_path / "run"
+    openmc_run.pincell_model(batches=20, keff_std=1e-3).export_to_xml(run_dir)
+    statepoint = run_dir / "statepoint.020.h5"
+    history_statepoint(statepoint, np.ones(20))
+    monkeypatch.setattr(openmc_run, "batches_run", lambda sp: 20)
+
+    def restart(cwd, threads, restart_file=None, callback=None):
+        assert restart_file == statepoint
+        history_statepoint(cwd / "statepoint.030.h5", np.ones(30))
+        return []
+
+    monkeypatch.setattr(openmc_run.telemetry, "run", restart)
+    kwargs = dict(
+        cache=SimulationCache(tmp_path / "cache"),
+        catalog=RunCatalog(tmp_path / "catalog.sqlite"),
+    )
+    with pytest.raises(ValueError):
+        openmc_run.extend_run(statepoint, 0, **kwargs)
+
+    extended = openmc_run.extend_run(statepoint, 10, **kwargs)
+    assert extended.name == "statepoint.030.h5"
+    settings = openmc.Settings.from_xml(run_dir / "settings.xml")
+    assert settings.batches == 30 and not settings.trigger_active
+    assert kwargs["catalog"].latest(statepoint=extended)["batches"] == 30
+
+
+def test_cache_hit_clears_metrics_of_the_previous_run(tmp_path, monkeypatch):
+    import numpy as np
+
+    from recore import openmc_run
+    from recore.cache import SimulationCache
+    from recore.catalog import RunCatalog
+    from recore.conftest import history_statepoint
+
+    def run(cwd, threads, callback=None):
+        (cwd / openmc_run.telemetry.METRICS_FILE).write_text("{}\n")
+        history_statepoint(cwd / "statepoint.020.h5", np.ones(20))
+        return []
+
+    monkeypatch.setattr(openmc_run.telemetry, "run", run)
+    kwargs = dict(
+        cwd=tmp_path / "run",
+        cache=SimulationCache(tmp_path / "cache"),
+        catalog=RunCatalog(tmp_path / "catalog.sqlite"),
+    )
+    openmc_run.build_pincell(**kwargs)
+    assert (tmp_path / "run" / "metrics.jsonl").exists()
+
+    openmc_run.build_pincell(**kwargs)  # same inputs: served from the cache
+    assert not (tmp_path / "run" / "metrics.jsonl").exists()
+    assert kwargs["catalog"].latest()["cached"]
+
+
+def test_run_after_cache_hit_does_not_overwrite_the_cache(tmp_path, monkeypatch):
+    import h5py
+    import numpy as np
+
+    from recore import openmc_run
+    from recore.cache import SimulationCache
+    from recore.catalog import RunCatalog
+    from recore.conftest import history_statepoint
+
+    def run(cwd, threads, callback=None):
+        # OpenMC truncates statepoint.020.h5 in place if it exists
+        with h5py.File(cwd / "statepoint.020.h5", "w") as f:
+            f["k_combined"] = [2.0, 0.0]
+        return []
+
+    cache = SimulationCache(tmp_path / "cache")
+    kwargs = dict(
+        cwd=tmp_path / "run",
+        cache=cache,
+        catalog=RunCatalog(tmp_path / "catalog.sqlite"),
+    )
+    (tmp_path / "run").mkdir()
+    model_a = openmc_run.pincell_model(enrich=15.0)
+    model_a.export_to_xml(tmp_path / "run")
+    key_a = openmc_run.model_key(tmp_path / "run", openmc_run._cross_sections())
+    entry = tmp_path / "a" / "statepoint.020.h5"
+    entry.parent.mkdir()
+    history_statepoint(entry, np.ones(20))
+    cache.store(key_a, entry)
+
+    monkeypatch.setattr(openmc_run.telemetry, "run", run)
+    openmc_run.build_pincell(enrich=15.0, **kwargs)  # hit: placed from cache
+    openmc_run.build_pincell(enrich=10.0, **kwargs)  # different model, same name
+    with h5py.File(cache.lookup(key_a), "r") as f:
+        assert f["k_combined"][0] == 1.1
@@ -0,0 +1,35 @@
+import numpy as np
+
+from recore import query
+from recore.tally_io import export_partitioned
+from recore.conftest import mesh_tally_statepoint
+
+
+def _export(tmp_path):
+    for case, n in (("a", 10), ("b", 20)):
+        path = tmp_path / case / "statepoint.020.h5"
+        path.parent.mkdir()
+        mesh_tally_statepoint(path, (4, 3, 2), ["flux", "fission"], n=n)
+        export_partitioned(path, tmp_path / "results")
+    return tmp_path / "results"
+
+
+def test_queries_on_partitioned_export(tmp_path):
+    root = _export(tmp_path)
+
+    plane = query.mesh_slice(root, z=1, run="a")
+    assert plane.shape == (12, 5)
+    assert plane["x"].max() == 3 and plane["y"].max() == 2
+
+    diff = query.compare_runs("a", "b", root)
+    assert diff.height == 24
+    assert np.allclose(
+        diff["ratio"].to_numpy(), 0.5
+    )  # same sums, twice the realizations
+
+    top = query.top_relative_error(root, n=5, run="a", score="fission")
+    assert top.height == 5
+    assert top["rel_err"].is_sorted(descending=True)
+
+    summed = query.sum_over_energy(root, run="b")
+    assert summed.height == 24
@@ -0,0 +1,17 @@
+import pytest
+
+pytest.importorskip("openmc")
+
+from recore import sweep
+
+
+def test_expand_grid_covers_every_combination():
+    grid = sweep.expand_grid(fuel_r=[0.35, 0.4], pitch=[1.2, 1.3, 1.4])
+    assert len(grid) == 6
+    assert {"fuel_r": 0.4, "pitch": 1.4} in grid
+
+
+def test_plan_workers_splits_cores_between_cases():
+    assert sweep.plan_workers(100, threads_per_case=4, cores=64) == 16
+    assert sweep.plan_workers(3, threads_per_case=1, cores=64) == 3
+    assert sweep.plan_workers(10, threads_per_case=128, cores=64) == 1
@@ -0,0 +1,147 @@
+import numpy as np
+import pyarrow.parquet as pq
+
+from recore.conftest import mesh_tally_statepoint
+from recore.tally_io import MeshTally
+
+
+def test_slabs_match_full_reshape(tmp_path):
+    path = tmp_path / "statepoint.020.h5"
+    dimension = (4, 3, 5)
+    results = mesh_tally_statepoint(path, dimension, ["flux", "fission"])
+    # x-fastest bin order, as OpenMC writes mesh tallies
+    full = (results[:, 1, 0] / 10).reshape(dimension[::-1]).transpose(2, 1, 0)
+
+    with MeshTally(path) as mesh:
+        assert mesh.dimension == dimension
+        blocks = [m for _, m, _ in mesh.slabs(chunk=2, score="fission")]
+        assert [b.shape[2] for b in blocks] == [2, 2, 1]
+        assert np.allclose(np.concatenate(blocks, axis=2), full)
+        assert np.allclose(mesh.sum_z(score="fission")[0], full.sum(axis=2))
+
+
+def test_tally_table_has_one_row_per_bin_nuclide_and_score(tmp_path):
+    from recore.tally_io import tally_table
+
+    path = tmp_path / "statepoint.020.h5"
+    dimension = (4, 3, 2)
+    results = mesh_tally_statepoint(path, dimension, ["flux", "fission"])
+    table = tally_table(path, 1)
+
+    assert table.num_rows == 24 * 2
+    assert table.schema.metadata[b"tally_name"] == b"flux_mesh"
+    rows = table.to_pydict()
+    # row 2 * 7 + 1 is bin 7 (ix=3, iy=1, iz=0), score "fission"
+    assert (rows["mesh_1_x"][15], rows["mesh_1_y"][15], rows["mesh_1_z"][15]) == (
+        3,
+        1,
+        0,
+    )
+    assert rows["score"][15] == "fission"
+    assert np.isclose(rows["mean"][15], results[7, 1, 0] / 10)
+
+
+def test_partitioned_export_prunes_to_one_score(tmp_path):
+    import pyarrow.dataset as pds
+
+    from recore.tally_io import export_partitioned
+
+    path = tmp_path / "case_0001" / "statepoint.020.h5"
+    path.parent.mkdir()
+    results = mesh_tally_statepoint(path, (4, 3, 2), ["flux", "fission"])
+    files = export_partitioned(path, tmp_path / "results", row_group_size=8)
+    assert len(files) == 2
+    assert files[1].parent.name == "score=fission"
+
+    dataset = pds.dataset(tmp_path / "results", format="parquet", partitioning="hive")
+    flux = dataset.to_table(filter=pds.field("score") == "flux")
+    assert flux.num_rows == 24
+    assert set(flux["run"].to_pylist()) == {"case_0001"}
+    assert np.allclose(flux["mean"].to_numpy(), results[:, 0, 0] / 10)
+    assert pq.ParquetFile(files[0]).metadata.num_row_groups == 3
+
+
+def test_mesh_array_round_trip(tmp_path):
+    from recore.mesh_array import MeshArray, read_mesh_array, write_mesh_array
+
+    mean = np.arange(2000 * 3, dtype=float).reshape(2000, 3)
+    mesh = MeshArray(mean, mean / 100, np.array([-1.0, 0.0]), np.array([1.0, 3.0]))
+    back = read_mesh_array(write_mesh_array(tmp_path / "mesh.parquet", mesh))
+
+    assert pq.read_schema(tmp_path / "mesh.parquet").names == ["mean", "std_dev"]
+    assert np.array_equal(back.mean, mean) and np.array_equal(back.std_dev, mean / 100)
+    x, y = back.centers()
+    assert np.allclose(y, [0.5, 1.5, 2.5]) and np.isclose(x[0], -1 + 1 / 2000)
+
+
+def test_sidecar_is_memory_mapped_and_invalidated(tmp_path):
+    import os
+
+    from recore.mesh_array import MeshArray, open_mesh_array, write_mesh_array
+
+    source = tmp_path / "statepoint.020.h5"
+    source.write_bytes(b"v1")
+    mesh = MeshArray(np.ones((4, 5)), None, np.zeros(2), np.ones(2))
+    path = write_mesh_array(tmp_path / "mesh_flux.parquet", mesh, source=source)
+
+    mapped = open_mesh_array(path, source=source)
+    assert np.array_equal(mapped.mean, mesh.mean)
+    assert not mapped.mean.flags.writeable  # a view of the mapped file
+
+    path.with_suffix(".arrow").unlink()
+    assert open_mesh_array(path, source=source) is not None  # rebuilt from Parquet
+    assert path.with_suffix(".arrow").exists()
+
+    os.utime(source, ns=(0, 0))
+    assert open_mesh_array(path, source=source) is None  # statepoint changed
+
+
+def test_analyze_reuses_result_until_statepoint_changes(tmp_path):
+    from recore.analyze import analyze
+
+    mesh_tally_statepoint(tmp_path / "statepoint.020.h5", (4, 3, 2), ["flux"])
+    first = analyze(tmp_path)
+    assert not first.cached and first.mesh.mean.shape == (4, 3)
+    assert (tmp_path / "mesh_flux.parquet").exists()
+    assert analyze(tmp_path).cached
+
+    mesh_tally_statepoint(tmp_path / "statepoint.030.h5", (4, 3, 2), ["flux"], n=20)
+    again = analyze(tmp_path)
+    assert not again.cached and again.statepoint.name == "statepoint.030.h5"
+
+
+def test_analyze_keeps_each_score_in_its_own_file(tmp_path):
+    from recore.analyze import analyze
+    from recore.mesh_array import read_mesh_array, write_mesh_array
+
+    mesh_tally_statepoint(
+        tmp_path / "statepoint.020.h5", (4, 3, 2), ["flux", "fission"]
+    )
+    flux = analyze(tmp_path)
+    fission = analyze(tmp_path, score="fission")
+    assert fission.parquet != flux.parquet
+    assert analyze(tmp_path).cached
+    assert read_mesh_array(flux.parquet).score == "flux"
+    assert read_mesh_array(fission.parquet).score == "fission"
+
+    write_mesh_array(flux.parquet, fission.mesh, source=fission.statepoint)
+    redone = analyze(tmp_path)  # file no longer holds the remembered result
+    assert not redone.cached and read_mesh_array(redone.parquet).score == "flux"
+
+
+def test_concurrent_sidecar_rebuilds_do_not_collide(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from recore.mesh_array import MeshArray, open_mesh_array, write_mesh_array
+
+    mesh = MeshArray(np.random.rand(400, 400), None, np.zeros(2), np.ones(2))
+    path = write_mesh_array(tmp_path / "mesh_flux.parquet", mesh)
+    for _ in range(5):
+        path.with_suffix(".arrow").unlink()
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: open_mesh_array(path), range(8)))
+        assert all(np.array_equal(r.mean, mesh.mean) for r in results)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "mesh_flux.arrow",
+        "mesh_flux.parquet",
+    ]
@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("openmc")
+
+from recore.telemetry import parse_batch_line
+
+
+def test_parse_batch_lines():
+    assert parse_batch_line("        1/1    1.23456\n") == (1, 1.23456, None, None)
+    assert parse_batch_line("       12/1    1.02345    1.01987 +/- 0.00321") == (
+        12,
+        1.02345,
+        1.01987,
+        0.00321,
+    )
+    assert (
+        parse_batch_line("  Bat./Gen.      k       Entropy         Average k") is None
+    )
+    assert parse_batch_line("        1/1    1.23456    6.12345") == (
+        1,
+        1.23456,
+        None,
+        None,
+    )
+    assert parse_batch_line(
+        "       12/1    1.02345    6.98765    1.01987 +/- 0.00321"
+    ) == (
+        12,
+        1.02345,
+        1.01987,
+        0.00321,
+    )
+    assert parse_batch_line(" Reading U235 from /data/U235.h5") is None
+    assert parse_batch_line("  Bat./Gen.      k            Average k") is None
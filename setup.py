@@ -12,6 +12,9 @@ setup(
         "openmc",
         "numpy",
         "pandas",
+        "h5py",
+        "pyarrow",
+        "polars",
     ],
     extras_require={
         "dev": [